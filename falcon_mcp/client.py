@@ -9,6 +9,7 @@ import os
 import platform
 import sys
 import threading
+import time
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
@@ -21,10 +22,28 @@ from falcon_mcp.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Requests rejected with HTTP 429 are retried after the API's advertised reset
+# time, or with exponential backoff when it does not say. The total wait stays
+# well inside the 60s MCP request timeout; a reset further out than the remaining
+# budget returns the 429 at once rather than sleeping past the caller.
+MAX_RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
+MAX_RATE_LIMIT_WAIT_SECONDS = 15.0
+
 
 class FalconClient:
     """Client for interacting with the CrowdStrike Falcon API."""
 
+    __slots__ = (
+        "base_url",
+        "debug",
+        "user_agent_comment",
+        "member_cid",
+        "proxy",
+        "client",
+        "_token_lock",
+    )
+
     def __init__(
         self,
         base_url: str | None = None,
@@ -47,9 +66,10 @@ class FalconClient:
             proxy: HTTP/HTTPS proxy URL for outbound Falcon API connections (defaults to FALCON_PROXY_URL env var).
                    Example: "http://proxy.corp.example.com:8080"
         """
-        # Get credentials from parameters or environment variables (parameters take precedence)
-        self.client_id = client_id or os.environ.get("FALCON_CLIENT_ID")
-        self.client_secret = client_secret or os.environ.get("FALCON_CLIENT_SECRET")
+        # Get credentials from parameters or environment variables (parameters take precedence).
+        # They are handed to APIHarnessV2 and not retained on this object.
+        client_id = client_id or os.environ.get("FALCON_CLIENT_ID")
+        client_secret = client_secret or os.environ.get("FALCON_CLIENT_SECRET")
         self.base_url = base_url or os.environ.get(
             "FALCON_BASE_URL", "https://api.crowdstrike.com"
         )
@@ -60,7 +80,7 @@ class FalconClient:
         self.member_cid = member_cid or os.environ.get("FALCON_MEMBER_CID")
         self.proxy = proxy or os.environ.get("FALCON_PROXY_URL")
 
-        if not self.client_id or not self.client_secret:
+        if not client_id or not client_secret:
             raise ValueError(
                 "Falcon API credentials not provided. Either pass client_id and client_secret "
                 "parameters or set FALCON_CLIENT_ID and FALCON_CLIENT_SECRET environment variables."
@@ -68,8 +88,8 @@ class FalconClient:
 
         # Build APIHarnessV2 initialization parameters
         api_params: dict[str, Any] = {
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
+            "client_id": client_id,
+            "client_secret": client_secret,
             "base_url": self.base_url,
             "debug": debug,
             "user_agent": self.get_user_agent(),
@@ -202,6 +222,34 @@ class FalconClient:
         """
         self._ensure_token_fresh()
         result: dict[str, Any] = self.client.command(operation, **kwargs)
+
+        # A 429 means the request was rejected, not applied, so it is safe to retry
+        # once the rate limit window resets. Binary download endpoints return raw
+        # bytes rather than a response dict, so only dicts are inspected.
+        waited = 0.0
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            if not isinstance(result, dict) or result.get("status_code") != 429:
+                break
+            delay = _rate_limit_delay(result, attempt)
+            if waited + delay > MAX_RATE_LIMIT_WAIT_SECONDS:
+                logger.warning(
+                    "Rate limited on %s, reset in %.1fs exceeds the retry budget",
+                    operation,
+                    delay,
+                )
+                break
+            logger.warning(
+                "Rate limited on %s, retrying in %.1fs (attempt %d of %d)",
+                operation,
+                delay,
+                attempt + 1,
+                MAX_RATE_LIMIT_RETRIES,
+            )
+            time.sleep(delay)
+            waited += delay
+            self._ensure_token_fresh()
+            result = self.client.command(operation, **kwargs)
+
         return result
 
     async def command_async(self, operation: str, **kwargs: Any) -> dict[str, Any]:
@@ -271,6 +319,32 @@ class FalconClient:
         return headers
 
 
+def _rate_limit_delay(response: dict[str, Any], attempt: int) -> float:
+    """Work out how long to wait before retrying a rate-limited request.
+
+    Falcon reports when the rate limit window resets as an epoch timestamp in the
+    `X-Ratelimit-Retryafter` header. Without it, back off exponentially.
+
+    Args:
+        response: The 429 API response
+        attempt: Zero-based retry attempt number
+
+    Returns:
+        float: Seconds to wait, never negative
+    """
+    headers = response.get("headers") or {}
+    retry_after = next(
+        (v for k, v in headers.items() if k.lower() == "x-ratelimit-retryafter"), None
+    )
+    delay = RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+    if retry_after is not None:
+        try:
+            delay = float(retry_after) - time.time()
+        except (TypeError, ValueError):
+            pass
+    return max(delay, 0.0)
+
+
 def get_version() -> str:
     """Get falcon-mcp version with multiple fallback methods.
 
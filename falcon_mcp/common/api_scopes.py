@@ -4,276 +4,301 @@ API scope definitions and utilities for Falcon MCP Server
 This module provides API scope definitions and related utilities for the Falcon MCP server.
 """
 
+from collections.abc import Iterable
+from types import MappingProxyType
+
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Returned for unmapped operations; shared so a miss allocates nothing.
+_NO_SCOPES: tuple[str, ...] = ()
+
 # Map of API operations to required scopes
-# This can be expanded as more modules and operations are added
-API_SCOPE_REQUIREMENTS = {
+# This can be expanded as more modules and operations are added. Read-only, with
+# tuple values, so callers cannot mutate the shared table through a lookup result.
+API_SCOPE_REQUIREMENTS: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
     # Alerts operations (migrated from detections)
-    "GetQueriesAlertsV2": ["Alerts:read"],
-    "PostEntitiesAlertsV2": ["Alerts:read"],
-    "PostAggregatesAlertsV2": ["Alerts:read"],
-    "PatchEntitiesAlertsV3": ["Alerts:write"],
+    "GetQueriesAlertsV2": ("Alerts:read",),
+    "PostEntitiesAlertsV2": ("Alerts:read",),
+    "PostAggregatesAlertsV2": ("Alerts:read",),
+    "PatchEntitiesAlertsV3": ("Alerts:write",),
     # Hosts operations
-    "QueryDevicesByFilter": ["Hosts:read"],
-    "PostDeviceDetailsV2": ["Hosts:read"],
-    "UpdateDeviceTags": ["Hosts:write"],
+    "QueryDevicesByFilter": ("Hosts:read",),
+    "PostDeviceDetailsV2": ("Hosts:read",),
+    "UpdateDeviceTags": ("Hosts:write",),
     # Host Groups operations
-    "queryCombinedHostGroups": ["Host Groups:read"],
-    "queryCombinedGroupMembers": ["Host Groups:read"],
-    "createHostGroups": ["Host Groups:write"],
-    "updateHostGroups": ["Host Groups:write"],
-    "deleteHostGroups": ["Host Groups:write"],
-    "performGroupAction": ["Host Groups:write"],
+    "queryCombinedHostGroups": ("Host Groups:read",),
+    "queryCombinedGroupMembers": ("Host Groups:read",),
+    "createHostGroups": ("Host Groups:write",),
+    "updateHostGroups": ("Host Groups:write",),
+    "deleteHostGroups": ("Host Groups:write",),
+    "performGroupAction": ("Host Groups:write",),
     # Intel operations
-    "QueryIntelActorEntities": ["Actors (Falcon Intelligence):read"],
-    "QueryIntelIndicatorEntities": ["Indicators (Falcon Intelligence):read"],
-    "QueryIntelReportEntities": ["Reports (Falcon Intelligence):read"],
-    "GetMitreReport": ["Actors (Falcon Intelligence):read"],
+    "QueryIntelActorEntities": ("Actors (Falcon Intelligence):read",),
+    "QueryIntelIndicatorEntities": ("Indicators (Falcon Intelligence):read",),
+    "QueryIntelReportEntities": ("Reports (Falcon Intelligence):read",),
+    "GetMitreReport": ("Actors (Falcon Intelligence):read",),
     # IOC operations
-    "indicator_search_v1": ["IOC Management:read"],
-    "indicator_get_v1": ["IOC Management:read"],
-    "indicator_create_v1": ["IOC Management:write"],
-    "indicator_delete_v1": ["IOC Management:write"],
+    "indicator_search_v1": ("IOC Management:read",),
+    "indicator_get_v1": ("IOC Management:read",),
+    "indicator_create_v1": ("IOC Management:write",),
+    "indicator_delete_v1": ("IOC Management:write",),
     # Firewall Management operations
-    "query_rules": ["Firewall Management:read"],
-    "get_rules": ["Firewall Management:read"],
-    "query_rule_groups": ["Firewall Management:read"],
-    "get_rule_groups": ["Firewall Management:read"],
-    "query_policy_rules": ["Firewall Management:read"],
-    "create_rule_group": ["Firewall Management:write"],
-    "delete_rule_groups": ["Firewall Management:write"],
+    "query_rules": ("Firewall Management:read",),
+    "get_rules": ("Firewall Management:read",),
+    "query_rule_groups": ("Firewall Management:read",),
+    "get_rule_groups": ("Firewall Management:read",),
+    "query_policy_rules": ("Firewall Management:read",),
+    "create_rule_group": ("Firewall Management:write",),
+    "delete_rule_groups": ("Firewall Management:write",),
     # Spotlight operations
-    "combinedQueryVulnerabilities": ["Vulnerabilities:read"],
+    "combinedQueryVulnerabilities": ("Vulnerabilities:read",),
     # Discover operations
-    "combined_applications": ["Assets:read"],
-    "combined_hosts": ["Assets:read"],
+    "combined_applications": ("Assets:read",),
+    "combined_hosts": ("Assets:read",),
     # Cloud operations
-    "ReadContainerCombined": ["Falcon Container Image:read"],
-    "ReadContainerCount": ["Falcon Container Image:read"],
-    "ReadCombinedVulnerabilities": ["Falcon Container Image:read"],
+    "ReadContainerCombined": ("Falcon Container Image:read",),
+    "ReadContainerCount": ("Falcon Container Image:read",),
+    "ReadCombinedVulnerabilities": ("Falcon Container Image:read",),
     # CSPM Assets operations
-    "cloud_security_assets_queries": ["Cloud Security API Assets:read"],
-    "cloud_security_assets_entities_get": ["Cloud Security API Assets:read"],
+    "cloud_security_assets_queries": ("Cloud Security API Assets:read",),
+    "cloud_security_assets_entities_get": ("Cloud Security API Assets:read",),
     # CSPM IOM Findings operations (CloudSecurityDetections)
-    "cspm_evaluations_iom_queries": ["Cloud Security API Detections:read"],
-    "cspm_evaluations_iom_entities": ["Cloud Security API Detections:read"],
+    "cspm_evaluations_iom_queries": ("Cloud Security API Detections:read",),
+    "cspm_evaluations_iom_entities": ("Cloud Security API Detections:read",),
     # Cloud Security Risks operations
-    "combined_cloud_risks": ["Cloud Security API Risks:read"],
-    "ListCloudGroupsExternal": ["Cloud Groups V2:read"],
-    "ListCloudGroupsByIDExternal": ["Cloud Groups V2:read"],
+    "combined_cloud_risks": ("Cloud Security API Risks:read",),
+    "ListCloudGroupsExternal": ("Cloud Groups V2:read",),
+    "ListCloudGroupsByIDExternal": ("Cloud Groups V2:read",),
     # CSPM Suppression Rules (override endpoints)
-    "QuerySuppressionRules": ["Cloud Security Policies:read"],
-    "GetSuppressionRules": ["Cloud Security Policies:read"],
-    "CreateSuppressionRule": ["Cloud Security Policies:write"],
-    "DeleteSuppressionRules": ["Cloud Security Policies:write"],
+    "QuerySuppressionRules": ("Cloud Security Policies:read",),
+    "GetSuppressionRules": ("Cloud Security Policies:read",),
+    "CreateSuppressionRule": ("Cloud Security Policies:write",),
+    "DeleteSuppressionRules": ("Cloud Security Policies:write",),
     # Identity Protection operations
-    "api_preempt_proxy_post_graphql": [
+    "api_preempt_proxy_post_graphql": (
         "Identity Protection Entities:read",
         "Identity Protection Timeline:read",
         "Identity Protection Detections:read",
         "Identity Protection Assessment:read",
         "Identity Protection GraphQL:write",
-    ],
+    ),
     # Sensor Usage operations
-    "GetSensorUsageWeekly": ["Sensor Usage:read"],
+    "GetSensorUsageWeekly": ("Sensor Usage:read",),
     # Serverless operations
-    "GetCombinedVulnerabilitiesSARIF": ["Falcon Container Image:read"],
+    "GetCombinedVulnerabilitiesSARIF": ("Falcon Container Image:read",),
     # Scheduled Reports operations
-    "scheduled_reports_query": ["Scheduled Reports:read"],
-    "scheduled_reports_get": ["Scheduled Reports:read"],
-    "scheduled_reports_launch": ["Scheduled Reports:read"],
+    "scheduled_reports_query": ("Scheduled Reports:read",),
+    "scheduled_reports_get": ("Scheduled Reports:read",),
+    "scheduled_reports_launch": ("Scheduled Reports:read",),
     # Report Executions operations (same scope as Scheduled Reports)
-    "report_executions_query": ["Scheduled Reports:read"],
-    "report_executions_get": ["Scheduled Reports:read"],
-    "report_executions_download_get": ["Scheduled Reports:read"],
+    "report_executions_query": ("Scheduled Reports:read",),
+    "report_executions_get": ("Scheduled Reports:read",),
+    "report_executions_download_get": ("Scheduled Reports:read",),
     # NGSIEM operations
-    "StartSearchV1": ["NGSIEM:write"],
-    "GetSearchStatusV1": ["NGSIEM:read"],
-    "StopSearchV1": ["NGSIEM:write"],
+    "StartSearchV1": ("NGSIEM:write",),
+    "GetSearchStatusV1": ("NGSIEM:read",),
+    "StopSearchV1": ("NGSIEM:write",),
     # Real Time Response operations
-    "RTR_ListAllSessions": ["Real time response:read"],
-    "RTR_ListSessions": ["Real time response:read"],
-    "RTR_InitSession": ["Real time response:read"],
-    "RTR_DeleteSession": ["Real time response:read"],
-    "RTR_PulseSession": ["Real time response:read"],
-    "RTR_CheckCommandStatus": ["Real time response:read"],
-    "RTR_ExecuteCommand": ["Real time response:read"],
-    "RTR_ListFilesV2": ["Real time response:write"],
-    "RTRAuditSessions": ["real-time-response-audit:read"],
-    "RTR_AggregateSessions": ["Real time response:read"],
+    "RTR_ListAllSessions": ("Real time response:read",),
+    "RTR_ListSessions": ("Real time response:read",),
+    "RTR_InitSession": ("Real time response:read",),
+    "RTR_DeleteSession": ("Real time response:read",),
+    "RTR_PulseSession": ("Real time response:read",),
+    "RTR_CheckCommandStatus": ("Real time response:read",),
+    "RTR_ExecuteCommand": ("Real time response:read",),
+    "RTR_ListFilesV2": ("Real time response:write",),
+    "RTRAuditSessions": ("real-time-response-audit:read",),
+    "RTR_AggregateSessions": ("Real time response:read",),
     # Quarantine operations
-    "QueryQuarantineFiles": ["Quarantined Files:read"],
-    "GetQuarantineFiles": ["Quarantined Files:read"],
-    "ActionUpdateCount": ["Quarantined Files:read"],
-    "UpdateQuarantinedDetectsByIds": ["Quarantined Files:write"],
-    "UpdateQfByQuery": ["Quarantined Files:write"],
+    "QueryQuarantineFiles": ("Quarantined Files:read",),
+    "GetQuarantineFiles": ("Quarantined Files:read",),
+    "ActionUpdateCount": ("Quarantined Files:read",),
+    "UpdateQuarantinedDetectsByIds": ("Quarantined Files:write",),
+    "UpdateQfByQuery": ("Quarantined Files:write",),
     # Custom IOA operations
-    "query_rule_groups_full": ["Custom IOA Rules:read"],
-    "query_platformsMixin0": ["Custom IOA Rules:read"],
-    "get_platformsMixin0": ["Custom IOA Rules:read"],
-    "query_rule_types": ["Custom IOA Rules:read"],
-    "get_rule_types": ["Custom IOA Rules:read"],
-    "create_rule_groupMixin0": ["Custom IOA Rules:write"],
-    "update_rule_groupMixin0": ["Custom IOA Rules:write"],
-    "delete_rule_groupsMixin0": ["Custom IOA Rules:write"],
-    "create_rule": ["Custom IOA Rules:write"],
-    "update_rules_v2": ["Custom IOA Rules:write"],
-    "delete_rules": ["Custom IOA Rules:write"],
+    "query_rule_groups_full": ("Custom IOA Rules:read",),
+    "query_platformsMixin0": ("Custom IOA Rules:read",),
+    "get_platformsMixin0": ("Custom IOA Rules:read",),
+    "query_rule_types": ("Custom IOA Rules:read",),
+    "get_rule_types": ("Custom IOA Rules:read",),
+    "create_rule_groupMixin0": ("Custom IOA Rules:write",),
+    "update_rule_groupMixin0": ("Custom IOA Rules:write",),
+    "delete_rule_groupsMixin0": ("Custom IOA Rules:write",),
+    "create_rule": ("Custom IOA Rules:write",),
+    "update_rules_v2": ("Custom IOA Rules:write",),
+    "delete_rules": ("Custom IOA Rules:write",),
     # Shield (SaaS Security) operations
-    "GetSecurityChecksV3": ["SaaS Security:read"],
-    "GetSecurityCheckAffectedV3": ["SaaS Security:read"],
-    "GetMetricsV3": ["SaaS Security:read"],
-    "GetSecurityCheckComplianceV3": ["SaaS Security:read"],
-    "GetAlertsV3": ["SaaS Security:read"],
-    "GetActivityMonitorV3": ["SaaS Security:read"],
-    "GetUserInventoryV3": ["SaaS Security:read"],
-    "GetDeviceInventoryV3": ["SaaS Security:read"],
-    "GetAppInventory": ["SaaS Security:read"],
-    "GetAppInventoryUsers": ["SaaS Security:read"],
-    "GetAssetInventoryV3": ["SaaS Security:read"],
-    "GetIntegrationsV3": ["SaaS Security:read"],
-    "GetSystemUsersV3": ["SaaS Security:read"],
-    "GetSupportedSaasV3": ["SaaS Security:read"],
-    "GetSystemLogsV3": ["SaaS Security:read"],
-    "DismissSecurityCheckV3": ["SaaS Security:write"],
-    "DismissAffectedEntityV3": ["SaaS Security:write"],
+    "GetSecurityChecksV3": ("SaaS Security:read",),
+    "GetSecurityCheckAffectedV3": ("SaaS Security:read",),
+    "GetMetricsV3": ("SaaS Security:read",),
+    "GetSecurityCheckComplianceV3": ("SaaS Security:read",),
+    "GetAlertsV3": ("SaaS Security:read",),
+    "GetActivityMonitorV3": ("SaaS Security:read",),
+    "GetUserInventoryV3": ("SaaS Security:read",),
+    "GetDeviceInventoryV3": ("SaaS Security:read",),
+    "GetAppInventory": ("SaaS Security:read",),
+    "GetAppInventoryUsers": ("SaaS Security:read",),
+    "GetAssetInventoryV3": ("SaaS Security:read",),
+    "GetIntegrationsV3": ("SaaS Security:read",),
+    "GetSystemUsersV3": ("SaaS Security:read",),
+    "GetSupportedSaasV3": ("SaaS Security:read",),
+    "GetSystemLogsV3": ("SaaS Security:read",),
+    "DismissSecurityCheckV3": ("SaaS Security:write",),
+    "DismissAffectedEntityV3": ("SaaS Security:write",),
     # Case Management operations
-    "queries_cases_get_v1": ["Cases:read"],
-    "entities_cases_post_v2": ["Cases:read"],
-    "entities_cases_put_v2": ["Cases:write"],
-    "entities_cases_patch_v2": ["Cases:write"],
-    "entities_alert_evidence_post_v1": ["Cases:write"],
-    "entities_event_evidence_post_v1": ["Cases:write"],
-    "entities_case_tags_post_v1": ["Cases:write"],
-    "entities_case_tags_delete_v1": ["Cases:write"],
+    "queries_cases_get_v1": ("Cases:read",),
+    "entities_cases_post_v2": ("Cases:read",),
+    "entities_cases_put_v2": ("Cases:write",),
+    "entities_cases_patch_v2": ("Cases:write",),
+    "entities_alert_evidence_post_v1": ("Cases:write",),
+    "entities_event_evidence_post_v1": ("Cases:write",),
+    "entities_case_tags_post_v1": ("Cases:write",),
+    "entities_case_tags_delete_v1": ("Cases:write",),
     # Case Templates operations
-    "queries_templates_get_v1": ["Case Templates:read"],
-    "entities_templates_get_v1": ["Case Templates:read"],
+    "queries_templates_get_v1": ("Case Templates:read",),
+    "entities_templates_get_v1": ("Case Templates:read",),
     # Case Management aggregate operations
-    "aggregates_slas_post_v1": ["Case Templates:read"],
-    "aggregates_templates_post_v1": ["Case Templates:read"],
-    "aggregates_access_tags_post_v1": ["Case Templates:read"],
-    "aggregates_notification_groups_post_v2": ["Case Templates:read"],
-    "aggregates_file_details_post_v1": ["Cases:read"],
+    "aggregates_slas_post_v1": ("Case Templates:read",),
+    "aggregates_templates_post_v1": ("Case Templates:read",),
+    "aggregates_access_tags_post_v1": ("Case Templates:read",),
+    "aggregates_notification_groups_post_v2": ("Case Templates:read",),
+    "aggregates_file_details_post_v1": ("Cases:read",),
     # Correlation Rules operations
-    "combined_rules_get_v2": ["Correlation Rules:read"],
-    "entities_rules_post_v1": ["Correlation Rules:write"],
-    "entities_rules_patch_v1": ["Correlation Rules:write"],
-    "entities_rules_delete_v1": ["Correlation Rules:write"],
+    "combined_rules_get_v2": ("Correlation Rules:read",),
+    "entities_rules_post_v1": ("Correlation Rules:write",),
+    "entities_rules_patch_v1": ("Correlation Rules:write",),
+    "entities_rules_delete_v1": ("Correlation Rules:write",),
     # Data Protection operations
-    "queries_classification_get_v2": ["Data Protection:read"],
-    "entities_classification_get_v2": ["Data Protection:read"],
-    "queries_policy_get_v2": ["Data Protection:read"],
-    "entities_policy_get_v2": ["Data Protection:read"],
-    "queries_content_pattern_get_v2": ["Data Protection:read"],
-    "entities_content_pattern_get": ["Data Protection:read"],
+    "queries_classification_get_v2": ("Data Protection:read",),
+    "entities_classification_get_v2": ("Data Protection:read",),
+    "queries_policy_get_v2": ("Data Protection:read",),
+    "entities_policy_get_v2": ("Data Protection:read",),
+    "queries_content_pattern_get_v2": ("Data Protection:read",),
+    "entities_content_pattern_get": ("Data Protection:read",),
     # Exclusions operations - IOA (v2)
-    "ss_ioa_exclusions_search_v2": ["IOA Exclusions:read"],
-    "ss_ioa_exclusions_get_v2": ["IOA Exclusions:read"],
-    "ss_ioa_exclusions_create_v2": ["IOA Exclusions:write"],
-    "ss_ioa_exclusions_update_v2": ["IOA Exclusions:write"],
-    "ss_ioa_exclusions_delete_v2": ["IOA Exclusions:write"],
+    "ss_ioa_exclusions_search_v2": ("IOA Exclusions:read",),
+    "ss_ioa_exclusions_get_v2": ("IOA Exclusions:read",),
+    "ss_ioa_exclusions_create_v2": ("IOA Exclusions:write",),
+    "ss_ioa_exclusions_update_v2": ("IOA Exclusions:write",),
+    "ss_ioa_exclusions_delete_v2": ("IOA Exclusions:write",),
     # Exclusions operations - Machine Learning (v2)
-    "exclusions_search_v2": ["Machine Learning Exclusions:read"],
-    "exclusions_get_v2": ["Machine Learning Exclusions:read"],
-    "exclusions_create_v2": ["Machine Learning Exclusions:write"],
-    "exclusions_update_v2": ["Machine Learning Exclusions:write"],
-    "exclusions_delete_v2": ["Machine Learning Exclusions:write"],
+    "exclusions_search_v2": ("Machine Learning Exclusions:read",),
+    "exclusions_get_v2": ("Machine Learning Exclusions:read",),
+    "exclusions_create_v2": ("Machine Learning Exclusions:write",),
+    "exclusions_update_v2": ("Machine Learning Exclusions:write",),
+    "exclusions_delete_v2": ("Machine Learning Exclusions:write",),
     # Exclusions operations - Sensor Visibility (v1)
-    "querySensorVisibilityExclusionsV1": ["Sensor Visibility Exclusions:read"],
-    "getSensorVisibilityExclusionsV1": ["Sensor Visibility Exclusions:read"],
-    "createSVExclusionsV1": ["Sensor Visibility Exclusions:write"],
-    "updateSensorVisibilityExclusionsV1": ["Sensor Visibility Exclusions:write"],
-    "deleteSensorVisibilityExclusionsV1": ["Sensor Visibility Exclusions:write"],
+    "querySensorVisibilityExclusionsV1": ("Sensor Visibility Exclusions:read",),
+    "getSensorVisibilityExclusionsV1": ("Sensor Visibility Exclusions:read",),
+    "createSVExclusionsV1": ("Sensor Visibility Exclusions:write",),
+    "updateSensorVisibilityExclusionsV1": ("Sensor Visibility Exclusions:write",),
+    "deleteSensorVisibilityExclusionsV1": ("Sensor Visibility Exclusions:write",),
     # Exclusions operations - Certificate-Based (v1, shares Machine Learning Exclusions scope)
-    "cb_exclusions_query_v1": ["Machine Learning Exclusions:read"],
-    "cb_exclusions_get_v1": ["Machine Learning Exclusions:read"],
-    "cb_exclusions_create_v1": ["Machine Learning Exclusions:write"],
-    "cb_exclusions_update_v1": ["Machine Learning Exclusions:write"],
-    "cb_exclusions_delete_v1": ["Machine Learning Exclusions:write"],
-    "certificates_get_v1": ["Machine Learning Exclusions:read"],
+    "cb_exclusions_query_v1": ("Machine Learning Exclusions:read",),
+    "cb_exclusions_get_v1": ("Machine Learning Exclusions:read",),
+    "cb_exclusions_create_v1": ("Machine Learning Exclusions:write",),
+    "cb_exclusions_update_v1": ("Machine Learning Exclusions:write",),
+    "cb_exclusions_delete_v1": ("Machine Learning Exclusions:write",),
+    "certificates_get_v1": ("Machine Learning Exclusions:read",),
     # Policies operations - Prevention (Cloud ML Policies scope also gates these)
-    "queryCombinedPreventionPolicies": ["Prevention Policies:read"],
-    "queryPreventionPolicies": ["Prevention Policies:read"],
-    "getPreventionPolicies": ["Prevention Policies:read"],
-    "queryCombinedPreventionPolicyMembers": ["Prevention Policies:read"],
-    "createPreventionPolicies": ["Prevention Policies:write"],
-    "updatePreventionPolicies": ["Prevention Policies:write"],
-    "deletePreventionPolicies": ["Prevention Policies:write"],
-    "performPreventionPoliciesAction": ["Prevention Policies:write"],
-    "setPreventionPoliciesPrecedence": ["Prevention Policies:write"],
+    "queryCombinedPreventionPolicies": ("Prevention Policies:read",),
+    "queryPreventionPolicies": ("Prevention Policies:read",),
+    "getPreventionPolicies": ("Prevention Policies:read",),
+    "queryCombinedPreventionPolicyMembers": ("Prevention Policies:read",),
+    "createPreventionPolicies": ("Prevention Policies:write",),
+    "updatePreventionPolicies": ("Prevention Policies:write",),
+    "deletePreventionPolicies": ("Prevention Policies:write",),
+    "performPreventionPoliciesAction": ("Prevention Policies:write",),
+    "setPreventionPoliciesPrecedence": ("Prevention Policies:write",),
     # Policies operations - Sensor Update
-    "queryCombinedSensorUpdatePoliciesV2": ["Sensor Update Policies:read"],
-    "querySensorUpdatePolicies": ["Sensor Update Policies:read"],
-    "getSensorUpdatePoliciesV2": ["Sensor Update Policies:read"],
-    "queryCombinedSensorUpdatePolicyMembers": ["Sensor Update Policies:read"],
-    "createSensorUpdatePoliciesV2": ["Sensor Update Policies:write"],
-    "updateSensorUpdatePoliciesV2": ["Sensor Update Policies:write"],
-    "deleteSensorUpdatePolicies": ["Sensor Update Policies:write"],
-    "performSensorUpdatePoliciesAction": ["Sensor Update Policies:write"],
-    "setSensorUpdatePoliciesPrecedence": ["Sensor Update Policies:write"],
+    "queryCombinedSensorUpdatePoliciesV2": ("Sensor Update Policies:read",),
+    "querySensorUpdatePolicies": ("Sensor Update Policies:read",),
+    "getSensorUpdatePoliciesV2": ("Sensor Update Policies:read",),
+    "queryCombinedSensorUpdatePolicyMembers": ("Sensor Update Policies:read",),
+    "createSensorUpdatePoliciesV2": ("Sensor Update Policies:write",),
+    "updateSensorUpdatePoliciesV2": ("Sensor Update Policies:write",),
+    "deleteSensorUpdatePolicies": ("Sensor Update Policies:write",),
+    "performSensorUpdatePoliciesAction": ("Sensor Update Policies:write",),
+    "setSensorUpdatePoliciesPrecedence": ("Sensor Update Policies:write",),
     # Policies operations - Firewall (gated by Firewall Management, like firewall.py)
-    "queryCombinedFirewallPolicies": ["Firewall Management:read"],
-    "queryFirewallPolicies": ["Firewall Management:read"],
-    "getFirewallPolicies": ["Firewall Management:read"],
-    "queryCombinedFirewallPolicyMembers": ["Firewall Management:read"],
-    "createFirewallPolicies": ["Firewall Management:write"],
-    "updateFirewallPolicies": ["Firewall Management:write"],
-    "deleteFirewallPolicies": ["Firewall Management:write"],
-    "performFirewallPoliciesAction": ["Firewall Management:write"],
-    "setFirewallPoliciesPrecedence": ["Firewall Management:write"],
+    "queryCombinedFirewallPolicies": ("Firewall Management:read",),
+    "queryFirewallPolicies": ("Firewall Management:read",),
+    "getFirewallPolicies": ("Firewall Management:read",),
+    "queryCombinedFirewallPolicyMembers": ("Firewall Management:read",),
+    "createFirewallPolicies": ("Firewall Management:write",),
+    "updateFirewallPolicies": ("Firewall Management:write",),
+    "deleteFirewallPolicies": ("Firewall Management:write",),
+    "performFirewallPoliciesAction": ("Firewall Management:write",),
+    "setFirewallPoliciesPrecedence": ("Firewall Management:write",),
     # Policies operations - Device Control
-    "queryCombinedDeviceControlPolicies": ["Device Control Policies:read"],
-    "queryDeviceControlPolicies": ["Device Control Policies:read"],
-    "getDeviceControlPoliciesV2": ["Device Control Policies:read"],
-    "queryCombinedDeviceControlPolicyMembers": ["Device Control Policies:read"],
-    "postDeviceControlPoliciesV2": ["Device Control Policies:write"],
-    "patchDeviceControlPoliciesV2": ["Device Control Policies:write"],
-    "deleteDeviceControlPolicies": ["Device Control Policies:write"],
-    "performDeviceControlPoliciesAction": ["Device Control Policies:write"],
-    "setDeviceControlPoliciesPrecedence": ["Device Control Policies:write"],
+    "queryCombinedDeviceControlPolicies": ("Device Control Policies:read",),
+    "queryDeviceControlPolicies": ("Device Control Policies:read",),
+    "getDeviceControlPoliciesV2": ("Device Control Policies:read",),
+    "queryCombinedDeviceControlPolicyMembers": ("Device Control Policies:read",),
+    "postDeviceControlPoliciesV2": ("Device Control Policies:write",),
+    "patchDeviceControlPoliciesV2": ("Device Control Policies:write",),
+    "deleteDeviceControlPolicies": ("Device Control Policies:write",),
+    "performDeviceControlPoliciesAction": ("Device Control Policies:write",),
+    "setDeviceControlPoliciesPrecedence": ("Device Control Policies:write",),
     # Policies operations - Response (Real Time Response policies)
-    "queryCombinedRTResponsePolicies": ["Response Policies:read"],
-    "queryRTResponsePolicies": ["Response Policies:read"],
-    "getRTResponsePolicies": ["Response Policies:read"],
-    "queryCombinedRTResponsePolicyMembers": ["Response Policies:read"],
-    "createRTResponsePolicies": ["Response Policies:write"],
-    "updateRTResponsePolicies": ["Response Policies:write"],
-    "deleteRTResponsePolicies": ["Response Policies:write"],
-    "performRTResponsePoliciesAction": ["Response Policies:write"],
-    "setRTResponsePoliciesPrecedence": ["Response Policies:write"],
+    "queryCombinedRTResponsePolicies": ("Response Policies:read",),
+    "queryRTResponsePolicies": ("Response Policies:read",),
+    "getRTResponsePolicies": ("Response Policies:read",),
+    "queryCombinedRTResponsePolicyMembers": ("Response Policies:read",),
+    "createRTResponsePolicies": ("Response Policies:write",),
+    "updateRTResponsePolicies": ("Response Policies:write",),
+    "deleteRTResponsePolicies": ("Response Policies:write",),
+    "performRTResponsePoliciesAction": ("Response Policies:write",),
+    "setRTResponsePoliciesPrecedence": ("Response Policies:write",),
     # Recon (Falcon Intelligence Recon) operations
-    "QueryNotificationsV1": ["Monitoring rules (Falcon Intelligence Recon):read"],
-    "GetNotificationsDetailedV1": ["Monitoring rules (Falcon Intelligence Recon):read"],
-    "QueryRulesV1": ["Monitoring rules (Falcon Intelligence Recon):read"],
-    "GetRulesV1": ["Monitoring rules (Falcon Intelligence Recon):read"],
-    "QueryNotificationsExposedDataRecordsV1": ["Monitoring rules (Falcon Intelligence Recon):read"],
-    "GetNotificationsExposedDataRecordsV1": ["Monitoring rules (Falcon Intelligence Recon):read"],
+    "QueryNotificationsV1": ("Monitoring rules (Falcon Intelligence Recon):read",),
+    "GetNotificationsDetailedV1": ("Monitoring rules (Falcon Intelligence Recon):read",),
+    "QueryRulesV1": ("Monitoring rules (Falcon Intelligence Recon):read",),
+    "GetRulesV1": ("Monitoring rules (Falcon Intelligence Recon):read",),
+    "QueryNotificationsExposedDataRecordsV1": ("Monitoring rules (Falcon Intelligence Recon):read",),
+    "GetNotificationsExposedDataRecordsV1": ("Monitoring rules (Falcon Intelligence Recon):read",),
     # Policies operations - Content Update
-    "queryCombinedContentUpdatePolicies": ["Content Update Policies:read"],
-    "queryContentUpdatePolicies": ["Content Update Policies:read"],
-    "getContentUpdatePolicies": ["Content Update Policies:read"],
-    "queryCombinedContentUpdatePolicyMembers": ["Content Update Policies:read"],
-    "createContentUpdatePolicies": ["Content Update Policies:write"],
-    "updateContentUpdatePolicies": ["Content Update Policies:write"],
-    "deleteContentUpdatePolicies": ["Content Update Policies:write"],
-    "performContentUpdatePoliciesAction": ["Content Update Policies:write"],
-    "setContentUpdatePoliciesPrecedence": ["Content Update Policies:write"],
-}
+    "queryCombinedContentUpdatePolicies": ("Content Update Policies:read",),
+    "queryContentUpdatePolicies": ("Content Update Policies:read",),
+    "getContentUpdatePolicies": ("Content Update Policies:read",),
+    "queryCombinedContentUpdatePolicyMembers": ("Content Update Policies:read",),
+    "createContentUpdatePolicies": ("Content Update Policies:write",),
+    "updateContentUpdatePolicies": ("Content Update Policies:write",),
+    "deleteContentUpdatePolicies": ("Content Update Policies:write",),
+    "performContentUpdatePoliciesAction": ("Content Update Policies:write",),
+    "setContentUpdatePoliciesPrecedence": ("Content Update Policies:write",),
+})
 
 
-def get_required_scopes(operation: str | None) -> list[str]:
+def get_required_scopes(operation: str | None) -> tuple[str, ...]:
     """Get the required API scopes for a specific operation.
 
     Args:
         operation: The API operation name
 
     Returns:
-        List[str]: List of required API scopes
+        tuple[str, ...]: Required API scopes, empty for unmapped operations
     """
     if operation is None:
-        return []
-    return API_SCOPE_REQUIREMENTS.get(operation, [])
+        return _NO_SCOPES
+    return API_SCOPE_REQUIREMENTS.get(operation, _NO_SCOPES)
+
+
+def get_required_scopes_many(operations: Iterable[str]) -> tuple[str, ...]:
+    """Get the combined API scopes required by several operations.
+
+    Unmapped operation names are skipped, so callers can pass any candidate
+    strings without filtering them first.
+
+    Args:
+        operations: The API operation names
+
+    Returns:
+        tuple[str, ...]: Sorted, de-duplicated union of the required scopes
+    """
+    scopes: set[str] = set()
+    for operation in operations:
+        scopes.update(API_SCOPE_REQUIREMENTS.get(operation, _NO_SCOPES))
+    return tuple(sorted(scopes))
@@ -0,0 +1,158 @@
+"""
+Caching utilities for Falcon MCP Server
+
+This module provides a small in-process cache for idempotent Falcon API reads
+and a helper that coalesces identical requests that are in flight at once.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+
+class TTLCache:
+    """Thread-safe, size-bounded cache whose entries expire after a fixed TTL.
+
+    Tool handlers run on worker threads (see `offload_to_thread`), so every
+    access takes a lock. When the cache is full the least recently used entry
+    is evicted.
+
+    A fetch that overlaps a write can return the pre-write record after the
+    writer has invalidated it. To keep such results out, read `generation`
+    before fetching and pass it to `set`; the store is skipped if any
+    invalidation happened in between.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every `invalidate` and `clear` call."""
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default` if absent or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Any: The cached value or `default`
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Store `value` under `key`, evicting the oldest entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            generation: `generation` read before `value` was fetched; the store
+                is skipped if the cache has been invalidated since
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        """Drop the given keys from the cache, ignoring ones that are absent.
+
+        Args:
+            keys: Cache keys to remove
+        """
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+class _InFlightCall:
+    """A call being executed by one thread on behalf of every waiter."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into a single execution.
+
+    The first thread to request a key runs the call; threads that ask for the
+    same key while it is running wait for, and share, its result (or its
+    exception). Nothing is retained once the call finishes, so this complements
+    rather than replaces a cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _InFlightCall] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Run `fn`, or wait for the in-flight run with the same `key`.
+
+        Args:
+            key: Identifies calls that are interchangeable
+            fn: Zero-argument callable performing the request
+
+        Returns:
+            Any: The result of `fn`, shared by every concurrent caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _InFlightCall()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
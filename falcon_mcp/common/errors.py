@@ -84,7 +84,7 @@ def _format_error_response(
         if details.get("status_code") == 403 and operation:
             required_scopes = get_required_scopes(operation)
             if required_scopes:
-                response["required_scopes"] = required_scopes
+                response["required_scopes"] = list(required_scopes)
                 scopes_list = ", ".join(required_scopes)
                 response["resolution"] = (
                     f"This operation requires the following API scopes: {scopes_list}. "
@@ -116,6 +116,7 @@ def handle_api_response(
         Dict[str, Any]|Any: The result or an error response
     """
     status_code: int | None = response.get("status_code")
+    body = response.get("body") or {}
 
     if status_code is None or status_code >= 300:
         # Get a more descriptive error message based on status code
@@ -124,7 +125,7 @@ def handle_api_response(
         )
 
         # Extract API error messages from response body
-        api_errors = response.get("body", {}).get("errors", [])
+        api_errors = body.get("errors") or []
         if api_errors:
             api_messages = [e.get("message", "") for e in api_errors if e.get("message")]
             if api_messages:
@@ -136,15 +137,13 @@ def handle_api_response(
             if required_scopes:
                 status_message += f" Required scopes: {', '.join(required_scopes)}"
 
-        # Log the error
-        logger.error("Error: %s: %s", error_message, status_message)
-
+        # _format_error_response logs the combined message, so it is logged once
         return _format_error_response(
             f"{error_message}: {status_message}", details=response, operation=operation
         )
 
     # Extract resources from the response body
-    resources = response.get("body", {}).get("resources", [])
+    resources = body.get("resources", [])
 
     if not resources and default_result is not None:
         return default_result
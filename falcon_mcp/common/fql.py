@@ -1,9 +1,12 @@
 """Shared FQL (Falcon Query Language) syntax constants.
 
 Provides a base operators section for interpolation into per-module FQL documentation,
-and a compact suffix for dynamic mode filter hints.
+a compact suffix for dynamic mode filter hints, and a lightweight syntax check that
+catches malformed filters before they cost an API round-trip.
 """
 
+import re
+
 FQL_BASE_OPERATORS = """=== BASIC SYNTAX ===
 property_name:[operator]'value'
 
@@ -36,3 +39,63 @@ FQL_FILTER_HINT_SUFFIX = (
     "FQL uses + for AND and , for OR (not the words AND/OR). "
     "Values must be single-quoted."
 )
+
+
+# Word operators outside quoted values; FQL combines conditions with + and , only
+_WORD_OPERATOR = re.compile(r"\s(AND|OR)\s")
+_QUOTES = frozenset("'\"")
+_OPENERS = {")": "(", "]": "["}
+
+
+def find_fql_syntax_error(expr: str | None) -> str | None:
+    """Return a description of a structural FQL error, or None if none is found.
+
+    This is a pre-flight check, not a full parser: it only rejects filters the API
+    is certain to refuse (unterminated quotes, unbalanced parentheses or brackets,
+    AND/OR used as words). Field names and values are left for the API to judge.
+
+    Args:
+        expr: FQL filter expression
+
+    Returns:
+        str | None: Error message, or None if the filter passed the check
+    """
+    if not expr:
+        return None
+
+    stack: list[tuple[str, int]] = []
+    unquoted: list[str] = []
+    quote: str | None = None
+    quote_start = 0
+    escaped = False
+    for pos, char in enumerate(expr):
+        if quote is not None:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+                unquoted.append(char)
+            continue
+
+        unquoted.append(char)
+        if char in _QUOTES:
+            quote, quote_start = char, pos
+        elif char in "([":
+            stack.append((char, pos))
+        elif char in _OPENERS:
+            if not stack or stack[-1][0] != _OPENERS[char]:
+                return f"Unbalanced '{char}' at position {pos}"
+            stack.pop()
+
+    if quote is not None:
+        return f"Unterminated quoted value starting at position {quote_start}"
+    if stack:
+        char, pos = stack[-1]
+        return f"Unclosed '{char}' at position {pos}"
+
+    match = _WORD_OPERATOR.search("".join(unquoted))
+    if match:
+        return f"'{match.group(1)}' is not an FQL operator; use + for AND and , for OR"
+    return None
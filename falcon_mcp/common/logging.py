@@ -6,8 +6,47 @@ This module provides logging utilities for the Falcon MCP server.
 
 import logging
 import sys
+import time
 from typing import Optional
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the seconds part of ``asctime`` once per second.
+
+    The default ``formatTime`` calls ``localtime`` and ``strftime`` for every
+    record. Bursts of log lines share the same second, so the rendered prefix is
+    cached and only the milliseconds are formatted per record.
+    """
+
+    # Same rendering as logging.Formatter.default_msec_format
+    msec_format = "%s,%03d"
+
+    _cached_second: int | None = None
+    _cached_prefix = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record's creation time, reusing the cached seconds prefix.
+
+        Args:
+            record: The log record being formatted
+            datefmt: Optional strftime format; bypasses the cache when given
+
+        Returns:
+            str: The formatted creation time
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_prefix = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+            self._cached_second = second
+        return self.msec_format % (self._cached_prefix, record.msecs)
+
 
 def configure_logging(debug: bool = False, name: str = "falcon_mcp") -> logging.Logger:
     """Configure logging for the Falcon MCP server.
@@ -22,10 +61,12 @@ def configure_logging(debug: bool = False, name: str = "falcon_mcp") -> logging.
     log_level = logging.DEBUG if debug else logging.INFO
 
     # Configure root logger
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(CachedTimeFormatter(LOG_FORMAT))
     logging.basicConfig(
         level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stderr)],
+        format=LOG_FORMAT,
+        handlers=[handler],
     )
 
     # Set third-party loggers to a higher level to reduce noise
@@ -4,7 +4,6 @@ Common utility functions for Falcon MCP Server
 This module provides common utility functions for the Falcon MCP server.
 """
 
-import re
 from typing import Any, Optional
 
 from .errors import _format_error_response, is_success_response
@@ -12,6 +11,10 @@ from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Backslashes, quotes and control characters that could be used for injection,
+# removed in a single C-level pass by str.translate
+_SANITIZE_TABLE = str.maketrans("", "", "\\\"'\n\r\t")
+
 
 def unwrap_field_default(value: Any) -> Any:
     """Resolve a Pydantic FieldInfo object to its actual default value."""
@@ -101,7 +104,7 @@ def sanitize_input(input_str: str) -> str:
         return str(input_str)
 
     # Remove backslashes, quotes, and control characters that could be used for injection
-    sanitized = re.sub(r'[\\"\'\n\r\t]', "", input_str)
+    sanitized = input_str.translate(_SANITIZE_TABLE)
 
     # Additional safety: limit length to prevent excessively long inputs
     return sanitized[:255]
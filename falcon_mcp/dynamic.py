@@ -18,12 +18,15 @@ from pydantic import Field
 from falcon_mcp.common.fql import FQL_FILTER_HINT_SUFFIX
 from falcon_mcp.common.logging import get_logger
 from falcon_mcp.filter_hints import FILTER_HINTS, QUERY_STRING_HINTS
-from falcon_mcp.modules.base import READ_ONLY_ANNOTATIONS, BaseModule
+from falcon_mcp.modules.base import (
+    READ_ONLY_ANNOTATIONS,
+    TOOL_NAME_PREFIX,
+    BaseModule,
+)
 from falcon_mcp.tool_filter import Resolution, ToolPolicy, ToolRecord
 
 logger = get_logger(__name__)
 
-_TOOL_PREFIX = "falcon_"
 _NON_ALNUM = re.compile(r"[^a-z0-9]+")
 
 # Relative weights only: a name match must outrank any number of description
@@ -71,7 +74,7 @@ class ToolEntry:
         ).lower()
 
         name = self.tool.name.lower()
-        self.unprefixed_name = name.removeprefix(_TOOL_PREFIX)
+        self.unprefixed_name = name.removeprefix(TOOL_NAME_PREFIX)
         self.name_words = _words(self.unprefixed_name)
         # Both spellings are accepted as an exact hit so a query can name the tool
         # with or without the server's prefix.
@@ -632,16 +635,19 @@ class DynamicMode:
         try:
             result = await entry.tool.run(parameters)
         except Exception as e:
+            # Render the exception once; pydantic ValidationError builds its
+            # message from every error entry on each str() call.
+            message = str(e)
             error_type = type(e).__name__
-            if "validation" in error_type.lower() or "valid" in str(e).lower():
+            if "validation" in error_type.lower() or "valid" in message.lower():
                 return {
-                    "error": f"Parameter validation failed: {e}",
+                    "error": f"Parameter validation failed: {message}",
                     "tool": tool_name,
                     "expected_parameters": self.catalog.summarize_parameters(
                         entry.tool.parameters
                     ),
                 }
-            return {"error": f"Execution failed: {e}", "tool": tool_name}
+            return {"error": f"Execution failed: {message}", "tool": tool_name}
 
         return self._normalize_empty(result)
 
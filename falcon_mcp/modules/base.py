@@ -4,7 +4,9 @@ Base module for Falcon MCP Server
 This module provides the base class for all Falcon MCP server modules.
 """
 
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, wait
 from functools import partial, wraps
 from inspect import iscoroutinefunction
 from typing import Any, Callable
@@ -21,6 +23,20 @@ from falcon_mcp.common.utils import filter_none_values, prepare_api_parameters
 
 logger = get_logger(__name__)
 
+# Prefix applied to every tool name registered through _add_tool
+TOOL_NAME_PREFIX = "falcon_"
+
+# Helper threads that _map_concurrently may use at once across the whole process.
+# They come on top of the anyio worker threads serving tool calls, so this caps the
+# extra request rate fan-outs add, however many tool calls fan out together.
+MAX_FAN_OUT_WORKERS = 8
+
+_fan_out_executor = ThreadPoolExecutor(
+    max_workers=MAX_FAN_OUT_WORKERS, thread_name_prefix="falcon-mcp-fan-out"
+)
+# One slot per pool thread: a submitted call always has a thread to run on
+_fan_out_slots = threading.BoundedSemaphore(MAX_FAN_OUT_WORKERS)
+
 # Default: read-only tool that talks to an external API
 READ_ONLY_ANNOTATIONS = ToolAnnotations(
     readOnlyHint=True,
@@ -119,7 +135,7 @@ class BaseModule(ABC):
             name: Tool name
             annotations: MCP tool annotations. Defaults to READ_ONLY_ANNOTATIONS.
         """
-        prefixed_name = f"falcon_{name}"
+        prefixed_name = TOOL_NAME_PREFIX + name
         server.add_tool(
             offload_to_thread(method),
             name=prefixed_name,
@@ -150,6 +166,7 @@ class BaseModule(ABC):
         id_key: str = "ids",
         use_params: bool = False,
         parameters: dict[str, Any] | None = None,
+        batch_size: int | None = None,
         **additional_params: Any,
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """Helper method for API operations that retrieve entities by IDs.
@@ -166,12 +183,33 @@ class BaseModule(ABC):
                        If False, send as request body (POST). Default: False
             parameters: Query-string parameters, for operations that declare an
                 option `in: query` even when the IDs travel in a POST body
+            batch_size: Maximum IDs per request. Longer lists are split into
+                batches fetched concurrently through _map_concurrently and the
+                results concatenated in batch order. If a batch fails, its error
+                is returned and no later batches are requested.
             **additional_params: Additional parameters to include alongside the
                 IDs, in the body or query string per `use_params`
 
         Returns:
             List of entity details or error dict
         """
+        if batch_size and len(ids) > batch_size:
+            batches = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+            fetch = partial(
+                self._base_get_by_ids,
+                operation,
+                id_key=id_key,
+                use_params=use_params,
+                parameters=parameters,
+                **additional_params,
+            )
+            entities: list[dict[str, Any]] = []
+            for result in self._map_concurrently(fetch, batches):
+                if self._is_error(result):
+                    return result
+                entities.extend(result)
+            return entities
+
         # Build the request params with dynamic ID key and additional parameters
         request_params = {id_key: ids}
         request_params.update(additional_params)
@@ -237,6 +275,69 @@ class BaseModule(ABC):
 
         return result
 
+    def _map_concurrently(self, fetch: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+        """Call `fetch` for every item, sharing the work with the fan-out pool.
+
+        The calling thread works through the items itself and only borrows pool
+        threads whose slots are free right now, so it never waits for the pool
+        and nested fan-outs cannot deadlock. Items are started in order and none
+        are started once a call has returned an error.
+
+        Args:
+            fetch: Callable issuing the request for one item
+            items: Items to fetch
+
+        Returns:
+            list[Any]: Results in item order, ending at the first error if any
+        """
+        lock = threading.Lock()
+        pending = iter(enumerate(items))
+        results: dict[int, Any] = {}
+        stopped = False
+
+        def work() -> None:
+            nonlocal stopped
+            while True:
+                with lock:
+                    claimed = None if stopped else next(pending, None)
+                if claimed is None:
+                    return
+                index, item = claimed
+                try:
+                    result = fetch(item)
+                except BaseException:
+                    with lock:
+                        stopped = True
+                    raise
+                with lock:
+                    results[index] = result
+                    stopped = stopped or self._is_error(result)
+
+        def help_out() -> None:
+            try:
+                work()
+            finally:
+                _fan_out_slots.release()
+
+        helpers = []
+        for _ in range(len(items) - 1):
+            if not _fan_out_slots.acquire(blocking=False):
+                break
+            helpers.append(_fan_out_executor.submit(help_out))
+        try:
+            work()
+        finally:
+            wait(helpers)
+        for helper in helpers:
+            helper.result()
+
+        ordered: list[Any] = []
+        for index in sorted(results):
+            ordered.append(results[index])
+            if self._is_error(results[index]):
+                break
+        return ordered
+
     def _base_search_api_call(
         self,
         operation: str,
@@ -372,18 +473,7 @@ class BaseModule(ABC):
                 return command_response.decode('utf-8')
             return command_response
 
-        # Dict response - check status code and use standard error handling
-        status_code = command_response.get("status_code")
-
-        if status_code != 200:
-            return handle_api_response(
-                command_response,
-                operation=operation,
-                error_message=error_message,
-                default_result=[],
-            )
-
-        # Standard response handling for dict responses
+        # Dict response - handle_api_response covers both the success and error paths
         return handle_api_response(
             command_response,
             operation=operation,
@@ -27,6 +27,8 @@ from falcon_mcp.resources.cloud import (
 
 logger = get_logger(__name__)
 
+VALID_SUPPRESSION_REASONS = frozenset({"accept-risk", "compensating-control", "false-positive"})
+
 
 class CloudModule(BaseModule):
     """Module for accessing and analyzing CrowdStrike Falcon cloud resources."""
@@ -946,11 +948,10 @@ class CloudModule(BaseModule):
         and a suppression reason. Setting an expiration_date is strongly recommended to
         avoid permanent suppressions. Returns the created suppression rule object.
         """
-        valid_reasons = {"accept-risk", "compensating-control", "false-positive"}
-        if suppression_reason not in valid_reasons:
+        if suppression_reason not in VALID_SUPPRESSION_REASONS:
             return {
                 "error": f"Invalid suppression_reason: '{suppression_reason}'",
-                "details": f"Must be one of: {', '.join(sorted(valid_reasons))}",
+                "details": f"Must be one of: {', '.join(sorted(VALID_SUPPRESSION_REASONS))}",
             }
 
         # Build rule selection filter
@@ -12,7 +12,11 @@ from mcp.server.fastmcp.resources import TextResource
 from mcp.types import ToolAnnotations
 from pydantic import AnyUrl, Field
 
+from falcon_mcp.client import FalconClient
+from falcon_mcp.common.cache import SingleFlight, TTLCache
+from falcon_mcp.common.fql import find_fql_syntax_error
 from falcon_mcp.common.logging import get_logger
+from falcon_mcp.common.utils import unwrap_field_default
 from falcon_mcp.modules.base import BaseModule
 from falcon_mcp.resources.detections import (
     SEARCH_DETECTIONS_FQL_DOCUMENTATION,
@@ -24,10 +28,47 @@ logger = get_logger(__name__)
 # IDs with HTTP 413 ("request too large").
 MAX_UPDATE_COMPOSITE_IDS = 1000
 
+# PostEntitiesAlertsV2 accepts at most this many composite IDs per request, while
+# search_detections can return up to 9999 IDs from a single query page and
+# get_detection_details takes caller-supplied lists of any length.
+MAX_DETAIL_COMPOSITE_IDS = 1000
+
+# Alert records change through triage (status, assignee, tags), so details are
+# only reused briefly; update_detections invalidates the IDs it touches.
+ALERT_DETAILS_CACHE_TTL_SECONDS = 60
+ALERT_DETAILS_CACHE_MAXSIZE = 4096
+
+# Searches that matched nothing are remembered for a short window only, so new
+# alerts surface quickly; update_detections clears them outright.
+EMPTY_SEARCH_CACHE_TTL_SECONDS = 15
+EMPTY_SEARCH_CACHE_MAXSIZE = 1024
+
+VALID_UPDATE_STATUSES = frozenset({"new", "in_progress", "reopened", "closed"})
+
+# Conventional resolution tags the Falcon console surfaces in its Resolution column
+RESOLUTION_TAGS = frozenset({"true_positive", "false_positive", "ignored"})
+
 
 class DetectionsModule(BaseModule):
     """Module for accessing and analyzing CrowdStrike Falcon detections."""
 
+    def __init__(self, client: FalconClient):
+        """Initialize the module.
+
+        Args:
+            client: Falcon API client
+        """
+        super().__init__(client)
+        self._alert_cache = TTLCache(
+            maxsize=ALERT_DETAILS_CACHE_MAXSIZE, ttl=ALERT_DETAILS_CACHE_TTL_SECONDS
+        )
+        self._empty_searches = TTLCache(
+            maxsize=EMPTY_SEARCH_CACHE_MAXSIZE, ttl=EMPTY_SEARCH_CACHE_TTL_SECONDS
+        )
+        # Agents often fire the same search or detail lookup from several
+        # concurrent tool calls; identical in-flight requests share one round-trip.
+        self._alert_fetches = SingleFlight()
+
     def register_tools(self, server: FastMCP) -> None:
         """Register tools with the MCP server.
 
@@ -159,18 +200,33 @@ class DetectionsModule(BaseModule):
         tactic/technique details, and threat classification.
         Responses include `pagination.total` (the total number of records matching the filter, or null when the API does not report a count) — use it to answer "how many" questions.
         """
-        detection_ids, pagination = self._base_search_with_meta(
-            operation="GetQueriesAlertsV2",
-            search_params={
-                "filter": filter,
-                "limit": limit,
-                "offset": offset,
-                "q": q,
-                "sort": sort,
-                "include_hidden": include_hidden,
-            },
-            error_message="Failed to search detections",
-        )
+        # Structurally broken filters are rejected locally, saving a round-trip
+        fql_error = find_fql_syntax_error(unwrap_field_default(filter))
+        if fql_error:
+            return self._format_fql_error_response(
+                [{"error": f"Invalid FQL filter: {fql_error}"}],
+                filter,
+                SEARCH_DETECTIONS_FQL_DOCUMENTATION,
+            )
+
+        query_key = ("GetQueriesAlertsV2", filter, limit, offset, q, sort, include_hidden)
+        search_result = self._empty_searches.get(query_key)
+        if search_result is None:
+            search_result = self._alert_fetches.do(
+                query_key,
+                lambda: self._query_alerts(
+                    query_key,
+                    {
+                        "filter": filter,
+                        "limit": limit,
+                        "offset": offset,
+                        "q": q,
+                        "sort": sort,
+                        "include_hidden": include_hidden,
+                    },
+                ),
+            )
+        detection_ids, pagination = search_result
 
         # Handle search error - return with FQL guide
         if self._is_error(detection_ids):
@@ -183,12 +239,7 @@ class DetectionsModule(BaseModule):
             return self._build_pagination_envelope([], pagination, filter)
 
         # Get detection details - past FQL concerns, normal API flow
-        details = self._base_get_by_ids(
-            operation="PostEntitiesAlertsV2",
-            ids=detection_ids,
-            id_key="composite_ids",
-            parameters={"include_hidden": include_hidden},
-        )
+        details = self._get_alert_details(detection_ids, include_hidden)
 
         if self._is_error(details):
             return [details]
@@ -220,12 +271,99 @@ class DetectionsModule(BaseModule):
         """
         logger.debug("Getting detection details for ID(s): %s", ids)
 
-        return self._base_get_by_ids(
+        return self._get_alert_details(ids, include_hidden)
+
+    def _get_alert_details(
+        self, ids: list[str], include_hidden: bool
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Fetch alert entities for composite IDs, reusing recently fetched ones.
+
+        Cached entries are keyed by `(composite_id, include_hidden)` because the
+        flag decides whether hidden alerts come back at all. IDs not in the cache
+        are fetched in one call, shared with any identical fetch already in flight.
+
+        Args:
+            ids: Composite alert IDs
+            include_hidden: Whether hidden alerts are returned
+
+        Returns:
+            List of alert details or error dict
+        """
+        cached: list[dict[str, Any]] = []
+        missing: list[str] = []
+        for composite_id in ids:
+            alert = self._alert_cache.get((composite_id, include_hidden))
+            if alert is None:
+                missing.append(composite_id)
+            else:
+                cached.append(alert)
+
+        if not missing:
+            return self._reorder_by_ids(ids, cached, id_field="composite_id")
+
+        details = self._alert_fetches.do(
+            ("PostEntitiesAlertsV2", tuple(missing), include_hidden),
+            lambda: self._fetch_alerts(missing, include_hidden),
+        )
+
+        if self._is_error(details):
+            return details
+
+        if not cached:
+            return details
+
+        return self._reorder_by_ids(ids, cached + details, id_field="composite_id")
+
+    def _query_alerts(
+        self, query_key: tuple[Any, ...], search_params: dict[str, Any]
+    ) -> tuple[list[dict[str, Any]] | dict[str, Any], dict[str, Any] | None]:
+        """Query alert IDs, briefly remembering searches that match nothing.
+
+        Agents iterating on a filter often repeat a zero-hit query. The result is
+        only cached if no update_detections call cleared the cache meanwhile.
+        """
+        generation = self._empty_searches.generation
+        search_result = self._base_search_with_meta(
+            operation="GetQueriesAlertsV2",
+            search_params=search_params,
+            error_message="Failed to search detections",
+        )
+        detection_ids = search_result[0]
+        if not self._is_error(detection_ids) and not detection_ids:
+            self._empty_searches.set(query_key, search_result, generation=generation)
+        return search_result
+
+    def _fetch_alerts(
+        self, ids: list[str], include_hidden: bool
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Fetch alert entities and cache them, unless they raced an update."""
+        generation = self._alert_cache.generation
+        details = self._base_get_by_ids(
             operation="PostEntitiesAlertsV2",
             ids=ids,
             id_key="composite_ids",
             parameters={"include_hidden": include_hidden},
+            batch_size=MAX_DETAIL_COMPOSITE_IDS,
+        )
+        if isinstance(details, list):
+            for alert in details:
+                if alert.get("composite_id"):
+                    self._alert_cache.set(
+                        (alert["composite_id"], include_hidden), alert, generation=generation
+                    )
+        return details
+
+    def _invalidate_alerts(self, ids: list[str]) -> None:
+        """Drop cached details for `ids` and every remembered empty search.
+
+        Changed status, tags or assignee can make a previously empty search match.
+        """
+        self._alert_cache.invalidate(
+            (composite_id, include_hidden)
+            for composite_id in ids
+            for include_hidden in (True, False)
         )
+        self._empty_searches.clear()
 
     def aggregate_detections(
         self,
@@ -495,9 +633,10 @@ class DetectionsModule(BaseModule):
         if remove_tags_by_prefix is not None and remove_tags_by_prefix.strip() == "":
             return {"error": "remove_tags_by_prefix must not be empty or whitespace-only."}
 
-        _valid_statuses = {"new", "in_progress", "reopened", "closed"}
-        if status is not None and status not in _valid_statuses:
-            return {"error": f"status must be one of: {', '.join(sorted(_valid_statuses))}."}
+        if status is not None and status not in VALID_UPDATE_STATUSES:
+            return {
+                "error": f"status must be one of: {', '.join(sorted(VALID_UPDATE_STATUSES))}."
+            }
 
         if not ids:
             return {"error": "At least one detection ID must be provided."}
@@ -535,6 +674,45 @@ class DetectionsModule(BaseModule):
 
         body_base = {"action_parameters": action_parameters}
 
+        # Any batch may apply before a later one fails, so drop cached details for
+        # every targeted ID up front, and again once the PATCH calls are done so
+        # that records fetched while they were in flight are discarded too.
+        self._invalidate_alerts(ids)
+        try:
+            result = self._patch_alerts(ids, body_base)
+        finally:
+            self._invalidate_alerts(ids)
+
+        if self._is_error(result):
+            return result
+
+        # Soft hint: closing without adding a resolution tag in this call may leave the
+        # detection out of the console's Resolution view. Non-fatal — only wraps the success
+        # case. We only know this call's add_tags, not any resolution tag set previously.
+        if status == "closed" and not RESOLUTION_TAGS.intersection(add_tags or []):
+            return {
+                "result": result,
+                "hint": (
+                    "No resolution tag was added in this update call. The console convention is to "
+                    "add true_positive, false_positive, or ignored when closing a detection so it "
+                    "appears in the Resolution view (skip if a resolution tag was already set)."
+                ),
+            }
+
+        return result
+
+    def _patch_alerts(
+        self, ids: list[str], body_base: dict[str, Any]
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Apply an alert update in batches of at most MAX_UPDATE_COMPOSITE_IDS.
+
+        Args:
+            ids: Composite alert IDs to update
+            body_base: Request body without `composite_ids`
+
+        Returns:
+            Combined batch results, or the failing batch's error dict
+        """
         # PatchEntitiesAlertsV3 rejects more than MAX_UPDATE_COMPOSITE_IDS ids per
         # request with HTTP 413, so chunk larger requests and fail loudly if any
         # batch errors rather than reporting success on a truncated update.
@@ -564,22 +742,4 @@ class DetectionsModule(BaseModule):
             if isinstance(batch_result, list):
                 result.extend(batch_result)
 
-        # Soft hint: closing without adding a resolution tag in this call may leave the
-        # detection out of the console's Resolution view. Non-fatal — only wraps the success
-        # case. We only know this call's add_tags, not any resolution tag set previously.
-        _resolution_tags = {"true_positive", "false_positive", "ignored"}
-        if (
-            not self._is_error(result)
-            and status == "closed"
-            and not _resolution_tags.intersection(add_tags or [])
-        ):
-            return {
-                "result": result,
-                "hint": (
-                    "No resolution tag was added in this update call. The console convention is to "
-                    "add true_positive, false_positive, or ignored when closing a detection so it "
-                    "appears in the Resolution view (skip if a resolution tag was already set)."
-                ),
-            }
-
         return result
@@ -12,6 +12,8 @@ from mcp.server.fastmcp.resources import TextResource
 from mcp.types import ToolAnnotations
 from pydantic import AnyUrl, Field
 
+from falcon_mcp.client import FalconClient
+from falcon_mcp.common.cache import SingleFlight
 from falcon_mcp.common.errors import _format_error_response
 from falcon_mcp.common.logging import get_logger
 from falcon_mcp.modules.base import BaseModule
@@ -52,6 +54,18 @@ def _has_prefix(tag: str, prefix: str) -> bool:
 class HostsModule(BaseModule):
     """Module for accessing and managing CrowdStrike Falcon hosts/devices."""
 
+    def __init__(self, client: FalconClient):
+        """Initialize the module.
+
+        Args:
+            client: Falcon API client
+        """
+        super().__init__(client)
+        # Host records are not cached: group membership, policies and tags change
+        # through several modules, and a lookup right after one of those changes
+        # must see it. Only identical lookups already in flight are shared.
+        self._host_fetches = SingleFlight()
+
     def register_tools(self, server: FastMCP) -> None:
         """Register tools with the MCP server.
 
@@ -201,10 +215,14 @@ class HostsModule(BaseModule):
         if not ids:
             return []
 
-        return self._base_get_by_ids(
-            operation="PostDeviceDetailsV2",
-            ids=ids,
-            id_key="ids",
+        # Concurrent tool calls asking for the same hosts share one request
+        return self._host_fetches.do(
+            tuple(ids),
+            lambda: self._base_get_by_ids(
+                operation="PostDeviceDetailsV2",
+                ids=ids,
+                id_key="ids",
+            ),
         )
 
     def manage_host_grouping_tags(
@@ -7,6 +7,7 @@ Core use cases:
 """
 
 import json
+from collections import Counter
 from datetime import datetime
 from typing import Any
 
@@ -194,7 +195,7 @@ class IdpModule(BaseModule):
                 search_criteria,
             )
 
-        logger.debug(f"Resolved {len(resolved_entity_ids)} entities for investigation")
+        logger.debug("Resolved %d entities for investigation", len(resolved_entity_ids))
 
         # Step 3: Execute investigations based on requested types
         investigation_results = {}
@@ -214,7 +215,7 @@ class IdpModule(BaseModule):
                 investigation_type, resolved_entity_ids, investigation_params
             )
             if "error" in result:
-                logger.error(f"Error in {investigation_type} investigation: {result['error']}")
+                logger.error("Error in %s investigation: %s", investigation_type, result["error"])
                 return self._create_error_response(
                     f"Investigation failed during {investigation_type}: {result['error']}",
                     len(resolved_entity_ids),
@@ -313,7 +314,7 @@ class IdpModule(BaseModule):
         params,
     ):
         """Execute a single investigation type and return results or error."""
-        logger.debug(f"Executing {investigation_type} investigation")
+        logger.debug("Executing %s investigation", investigation_type)
 
         if investigation_type == "entity_details":
             return self._get_entity_details_batch(
@@ -349,7 +350,7 @@ class IdpModule(BaseModule):
                 {"include_risk_factors": True},
             )
 
-        logger.warning(f"Unknown investigation type: {investigation_type}")
+        logger.warning("Unknown investigation type: %s", investigation_type)
         return {"error": f"Unknown investigation type: {investigation_type}"}
 
     # ==========================================
@@ -951,7 +952,7 @@ class IdpModule(BaseModule):
     ):
         domain_names = identifiers.get("domain_names")
         if domain_names and isinstance(domain_names, list):
-            sanitized_domains = [sanitize_input(domain) for domain in domain_names]
+            sanitized_domains = list(map(sanitize_input, domain_names))
             domains_json = json.dumps(sanitized_domains)
             query_filters.append(f"domains: {domains_json}")
             query_fields.extend(["primaryDisplayName", "secondaryDisplayName"])
@@ -965,7 +966,7 @@ class IdpModule(BaseModule):
         query_filters,
     ):
         if ip_addresses and isinstance(ip_addresses, list) and not has_user_criteria:
-            sanitized_ips = [sanitize_input(ip) for ip in ip_addresses]
+            sanitized_ips = list(map(sanitize_input, ip_addresses))
             ips_json = json.dumps(sanitized_ips)
             query_filters.append(f"primaryDisplayNames: {ips_json}")
             query_filters.append("types: [ENDPOINT]")
@@ -1029,7 +1030,7 @@ class IdpModule(BaseModule):
         """Get timeline analysis for multiple entities."""
         timeline_results = []
 
-        for entity_id in entity_ids:
+        def fetch_timeline(entity_id: str) -> Any:
             graphql_query = self._build_timeline_query(
                 entity_id=entity_id,
                 start_time=options.get("start_time"),
@@ -1037,13 +1038,16 @@ class IdpModule(BaseModule):
                 event_types=options.get("event_types"),
                 limit=options.get("limit", 50),
             )
-
-            result = self._base_query_api_call(
+            return self._base_query_api_call(
                 operation="api_preempt_proxy_post_graphql",
                 body_params={"query": graphql_query},
                 error_message=f"Failed to get timeline for entity '{entity_id}'",
                 default_result=None,
             )
+
+        for entity_id, result in zip(
+            entity_ids, self._map_concurrently(fetch_timeline, entity_ids)
+        ):
             if self._is_error(result):
                 return result
 
@@ -1067,23 +1071,25 @@ class IdpModule(BaseModule):
     ) -> dict[str, Any]:
         """Analyze relationships for multiple entities."""
         relationship_results = []
+        relationship_depth = unwrap_field_default(options.get("relationship_depth", 2))
 
-        for entity_id in entity_ids:
-            relationship_depth = unwrap_field_default(options.get("relationship_depth", 2))
-
+        def fetch_relationships(entity_id: str) -> Any:
             graphql_query = self._build_relationship_analysis_query(
                 entity_id=entity_id,
                 relationship_depth=relationship_depth,
                 include_risk_context=options.get("include_risk_context", True),
                 limit=options.get("limit", 50),
             )
-
-            result = self._base_query_api_call(
+            return self._base_query_api_call(
                 operation="api_preempt_proxy_post_graphql",
                 body_params={"query": graphql_query},
                 error_message=f"Failed to analyze relationships for entity '{entity_id}'",
                 default_result=None,
             )
+
+        for entity_id, result in zip(
+            entity_ids, self._map_concurrently(fetch_relationships, entity_ids)
+        ):
             if self._is_error(result):
                 return result
 
@@ -1249,15 +1255,11 @@ class IdpModule(BaseModule):
         # Analyze common risk factors across entities
         if "risk_assessment" in investigation_results:
             risk_assessments = investigation_results["risk_assessment"].get("risk_assessments", [])
-            risk_factor_counts: dict[str, int] = {}
-
-            for assessment in risk_assessments:
-                for risk_factor in assessment.get("riskFactors", []):
-                    risk_type = risk_factor.get("type")
-                    if risk_type in risk_factor_counts:
-                        risk_factor_counts[risk_type] += 1
-                    else:
-                        risk_factor_counts[risk_type] = 1
+            risk_factor_counts = Counter(
+                risk_factor.get("type")
+                for assessment in risk_assessments
+                for risk_factor in assessment.get("riskFactors", [])
+            )
 
             # Find common risk factors (present in multiple entities)
             for risk_type, count in risk_factor_counts.items():
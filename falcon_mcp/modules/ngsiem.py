@@ -48,7 +48,8 @@ def _iso_to_epoch_ms(iso_timestamp: str) -> int:
     Returns:
         Unix epoch time in milliseconds
     """
-    dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
+    # fromisoformat accepts the "Z" UTC designator natively on Python 3.11+
+    dt = datetime.fromisoformat(iso_timestamp)
     return int(dt.timestamp() * 1000)
 
 
@@ -21,7 +21,7 @@ from typing import Any
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from falcon_mcp.common.api_scopes import API_SCOPE_REQUIREMENTS  # noqa: E402
+from falcon_mcp.common.api_scopes import get_required_scopes_many  # noqa: E402
 
 OUTPUT_DIR = PROJECT_ROOT / "docs" / "modules"
 SITE_BASE_PATH = "/falcon-mcp"
@@ -623,10 +623,7 @@ def extract_module_scopes(module_cls: type) -> list[str]:
 
     # Find all string literals that match known operation names
     all_strings = set(re.findall(r'["\'](\w+)["\']', source))
-    scopes: set[str] = set()
-    for op_name, op_scopes in API_SCOPE_REQUIREMENTS.items():
-        if op_name in all_strings:
-            scopes.update(op_scopes)
+    scopes = get_required_scopes_many(all_strings)
 
     # Sort: read scopes first, then write, alphabetically within each group
     return sorted(scopes, key=lambda s: (":write" in s, s))
@@ -662,10 +659,7 @@ def extract_tool_scopes(method: Any, module_cls: type) -> list[str]:
 
     # Find all string literals and look them up in API_SCOPE_REQUIREMENTS
     all_strings = set(re.findall(r'["\'](\w+)["\']', combined_source))
-    scopes: set[str] = set()
-    for op_name, op_scopes in API_SCOPE_REQUIREMENTS.items():
-        if op_name in all_strings:
-            scopes.update(op_scopes)
+    scopes = get_required_scopes_many(all_strings)
 
     return sorted(scopes, key=lambda s: (":write" in s, s))
 
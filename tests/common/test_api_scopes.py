@@ -6,8 +6,13 @@ import re
 import unittest
 import warnings
 from pathlib import Path
+from types import MappingProxyType
 
-from falcon_mcp.common.api_scopes import API_SCOPE_REQUIREMENTS, get_required_scopes
+from falcon_mcp.common.api_scopes import (
+    API_SCOPE_REQUIREMENTS,
+    get_required_scopes,
+    get_required_scopes_many,
+)
 
 
 class TestApiScopes(unittest.TestCase):
@@ -44,34 +49,47 @@ class TestApiScopes(unittest.TestCase):
         return operations
 
     def test_api_scope_requirements_structure(self):
-        """Test API_SCOPE_REQUIREMENTS dictionary structure."""
-        # Verify it's a dictionary
-        self.assertIsInstance(API_SCOPE_REQUIREMENTS, dict)
+        """Test API_SCOPE_REQUIREMENTS mapping structure."""
+        # Verify it's a read-only mapping
+        self.assertIsInstance(API_SCOPE_REQUIREMENTS, MappingProxyType)
+        with self.assertRaises(TypeError):
+            API_SCOPE_REQUIREMENTS["NewOperation"] = ("Hosts:read",)
 
         # Verify it has entries
         self.assertGreater(len(API_SCOPE_REQUIREMENTS), 0)
 
-        # Verify structure of entries (keys are strings, values are lists of strings)
+        # Verify structure of entries (keys are strings, values are tuples of strings)
         for operation, scopes in API_SCOPE_REQUIREMENTS.items():
             self.assertIsInstance(operation, str)
-            self.assertIsInstance(scopes, list)
+            self.assertIsInstance(scopes, tuple)
             for scope in scopes:
                 self.assertIsInstance(scope, str)
 
     def test_get_required_scopes(self):
         """Test get_required_scopes function."""
         # Test with known operations
-        self.assertEqual(get_required_scopes("GetQueriesAlertsV2"), ["Alerts:read"])
-        self.assertEqual(get_required_scopes("PostEntitiesAlertsV2"), ["Alerts:read"])
-        self.assertEqual(get_required_scopes("PatchEntitiesAlertsV3"), ["Alerts:write"])
+        self.assertEqual(get_required_scopes("GetQueriesAlertsV2"), ("Alerts:read",))
+        self.assertEqual(get_required_scopes("PostEntitiesAlertsV2"), ("Alerts:read",))
+        self.assertEqual(get_required_scopes("PatchEntitiesAlertsV3"), ("Alerts:write",))
         # Test with unknown operation
-        self.assertEqual(get_required_scopes("UnknownOperation"), [])
+        self.assertEqual(get_required_scopes("UnknownOperation"), ())
 
         # Test with empty string
-        self.assertEqual(get_required_scopes(""), [])
+        self.assertEqual(get_required_scopes(""), ())
 
         # Test with None (should handle gracefully)
-        self.assertEqual(get_required_scopes(None), [])
+        self.assertEqual(get_required_scopes(None), ())
+
+    def test_get_required_scopes_many(self):
+        """Test that scopes for several operations are merged and de-duplicated."""
+        result = get_required_scopes_many(
+            ["GetQueriesAlertsV2", "PostEntitiesAlertsV2", "QueryDevicesByFilter", "Unknown"]
+        )
+        self.assertEqual(result, ("Alerts:read", "Hosts:read"))
+
+        # No operations, or only unmapped ones, need no scopes
+        self.assertEqual(get_required_scopes_many([]), ())
+        self.assertEqual(get_required_scopes_many({"Unknown", ""}), ())
 
     def test_all_operations_have_scope_mappings(self):
         """Test that all operations used in modules have scope mappings defined."""
@@ -145,28 +163,28 @@ class TestApiScopes(unittest.TestCase):
         """Test that get_required_scopes integrates properly with error handling."""
         # Test with multiple known operations to ensure consistency
         test_cases = [
-            ("GetQueriesAlertsV2", ["Alerts:read"]),
-            ("QueryIntelActorEntities", ["Actors (Falcon Intelligence):read"]),
-            ("api_preempt_proxy_post_graphql", [
+            ("GetQueriesAlertsV2", ("Alerts:read",)),
+            ("QueryIntelActorEntities", ("Actors (Falcon Intelligence):read",)),
+            ("api_preempt_proxy_post_graphql", (
                 "Identity Protection Entities:read",
                 "Identity Protection Timeline:read",
                 "Identity Protection Detections:read",
                 "Identity Protection Assessment:read",
                 "Identity Protection GraphQL:write"
-            ])
+            ))
         ]
 
         for operation, expected_scopes in test_cases:
             with self.subTest(operation=operation):
                 result = get_required_scopes(operation)
                 self.assertEqual(result, expected_scopes)
-                self.assertIsInstance(result, list)
+                self.assertIsInstance(result, tuple)
                 for scope in result:
                     self.assertIsInstance(scope, str)
 
     def test_graceful_fallback_behavior(self):
         """Test that unmapped operations handle gracefully without breaking error handling."""
-        # Test edge cases that should return empty list
+        # Test edge cases that should return no scopes
         edge_cases = [
             None,
             "",
@@ -178,8 +196,8 @@ class TestApiScopes(unittest.TestCase):
         for test_case in edge_cases:
             with self.subTest(operation=test_case):
                 result = get_required_scopes(test_case)
-                self.assertEqual(result, [])
-                self.assertIsInstance(result, list)
+                self.assertEqual(result, ())
+                self.assertIsInstance(result, tuple)
 
     def test_scope_mapping_consistency(self):
         """Test that scope mappings are internally consistent and follow patterns."""
@@ -0,0 +1,134 @@
+"""
+Tests for the caching utilities.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from falcon_mcp.common.cache import SingleFlight, TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+
+    def test_get_and_set(self):
+        """Test storing and retrieving values."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", {"id": "a"})
+
+        self.assertEqual(cache.get("a"), {"id": "a"})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", "default"), "default")
+
+    @patch("falcon_mcp.common.cache.time.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        """Test that entries are dropped once their TTL elapses."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+
+        mock_monotonic.return_value = 159.9
+        self.assertEqual(cache.get("a"), 1)
+
+        mock_monotonic.return_value = 160.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_invalidate_and_clear(self):
+        """Test removing selected keys and clearing the cache."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate(["a", "missing"])
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_set_skips_values_fetched_before_invalidation(self):
+        """Test that a store carrying a stale generation is dropped."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        generation = cache.generation
+        cache.invalidate(["a"])
+
+        cache.set("a", "stale", generation=generation)
+        self.assertIsNone(cache.get("a"))
+
+        cache.set("a", "fresh", generation=cache.generation)
+        self.assertEqual(cache.get("a"), "fresh")
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test that callers with the same key wait for the leader's result."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return {"id": "a"}
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("a", fetch)))
+        leader.start()
+        started.wait(timeout=5)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("a", fetch)))
+            for _ in range(3)
+        ]
+        for thread in followers:
+            thread.start()
+        # Give the followers time to join the in-flight call before it finishes
+        time.sleep(0.2)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(timeout=5)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{"id": "a"}] * 4)
+
+    def test_sequential_calls_run_again(self):
+        """Test that results are not retained after the call completes."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        self.assertEqual(flight.do("a", lambda: next(counter)), 0)
+        self.assertEqual(flight.do("a", lambda: next(counter)), 1)
+
+    def test_exception_propagates(self):
+        """Test that the leader's exception is raised and the key is released."""
+        flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            flight.do("a", fail)
+        self.assertEqual(flight.do("a", lambda: "ok"), "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ Tests for the error handling utilities.
 """
 
 import unittest
+from types import MappingProxyType
 from unittest.mock import patch
 
 from falcon_mcp.common.api_scopes import API_SCOPE_REQUIREMENTS, get_required_scopes
@@ -62,10 +63,10 @@ class TestErrorUtils(unittest.TestCase):
     def test_get_required_scopes(self):
         """Test get_required_scopes function."""
         # Known operation
-        self.assertEqual(get_required_scopes("GetQueriesAlertsV2"), ["Alerts:read"])
+        self.assertEqual(get_required_scopes("GetQueriesAlertsV2"), ("Alerts:read",))
 
         # Unknown operation
-        self.assertEqual(get_required_scopes("UnknownOperation"), [])
+        self.assertEqual(get_required_scopes("UnknownOperation"), ())
 
     @patch("falcon_mcp.common.errors.logger")
     def test_format_error_response(self, mock_logger):
@@ -138,11 +139,10 @@ class TestErrorUtils(unittest.TestCase):
             "status_code": 403,
             "body": {"errors": [{"message": "Access denied"}]},
         }
-        # Add a test operation to API_SCOPE_REQUIREMENTS
-        original_scopes = API_SCOPE_REQUIREMENTS.copy()
-        API_SCOPE_REQUIREMENTS["TestOperation"] = ["test:read"]
+        # Add a test operation to the (read-only) scope table
+        patched_scopes = MappingProxyType({**API_SCOPE_REQUIREMENTS, "TestOperation": ("test:read",)})
 
-        try:
+        with patch("falcon_mcp.common.api_scopes.API_SCOPE_REQUIREMENTS", patched_scopes):
             result = handle_api_response(
                 response,
                 "TestOperation",
@@ -152,10 +152,26 @@ class TestErrorUtils(unittest.TestCase):
             self.assertIn("Permission denied", result["error"])
             self.assertIn("Required scopes: test:read", result["error"])
             self.assertEqual(result["details"], response)
-        finally:
-            # Restore original API_SCOPE_REQUIREMENTS
-            API_SCOPE_REQUIREMENTS.clear()
-            API_SCOPE_REQUIREMENTS.update(original_scopes)
+
+    @patch("falcon_mcp.common.errors.logger")
+    def test_handle_api_response_logs_error_once(self, mock_logger):
+        """Test that a failed response produces a single error log record."""
+        handle_api_response(
+            {"status_code": 500, "body": {"errors": []}},
+            "TestOperation",
+            error_message="Test failed",
+        )
+
+        mock_logger.error.assert_called_once()
+        self.assertIn("Test failed", mock_logger.error.call_args.args[1])
+
+    def test_handle_api_response_without_body(self):
+        """Test handle_api_response when the response has a null or missing body."""
+        result = handle_api_response({"status_code": 500, "body": None}, "TestOperation")
+        self.assertIn("error", result)
+
+        result = handle_api_response({"status_code": 200}, "TestOperation")
+        self.assertEqual(result, [])
 
 
 if __name__ == "__main__":
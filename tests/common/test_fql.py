@@ -0,0 +1,57 @@
+"""
+Tests for the FQL helpers.
+"""
+
+import unittest
+
+from falcon_mcp.common.fql import find_fql_syntax_error
+
+
+class TestFindFqlSyntaxError(unittest.TestCase):
+    """Test cases for the find_fql_syntax_error function."""
+
+    def test_valid_filters(self):
+        """Test that well-formed filters pass the check."""
+        for expr in (
+            None,
+            "",
+            "status:'new'",
+            "severity_name:'Critical',severity_name:'High'",
+            "(status:'new'+severity:>=50),product:['epp','idp']",
+            "created_timestamp:>'now-7d'",
+            "device.hostname:'SANDBOX OR LAB'",
+            "cmdline:'foo(' + tags:\"a)b\"",
+            "name:'it\\'s'",
+        ):
+            with self.subTest(expr=expr):
+                self.assertIsNone(find_fql_syntax_error(expr))
+
+    def test_unterminated_quote(self):
+        """Test that an unterminated quoted value is reported."""
+        self.assertEqual(
+            find_fql_syntax_error("status:'new"),
+            "Unterminated quoted value starting at position 7",
+        )
+
+    def test_unbalanced_grouping(self):
+        """Test that unbalanced parentheses and brackets are reported."""
+        self.assertEqual(
+            find_fql_syntax_error("(status:'new'"), "Unclosed '(' at position 0"
+        )
+        self.assertEqual(
+            find_fql_syntax_error("status:'new')"), "Unbalanced ')' at position 12"
+        )
+        self.assertEqual(
+            find_fql_syntax_error("product:['epp')"), "Unbalanced ')' at position 14"
+        )
+
+    def test_word_operators(self):
+        """Test that AND/OR written as words are reported."""
+        self.assertEqual(
+            find_fql_syntax_error("status:'new' AND severity:>50"),
+            "'AND' is not an FQL operator; use + for AND and , for OR",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
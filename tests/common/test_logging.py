@@ -6,7 +6,12 @@ import logging
 import unittest
 from unittest.mock import MagicMock, patch
 
-from falcon_mcp.common.logging import configure_logging, get_logger
+from falcon_mcp.common.logging import (
+    LOG_FORMAT,
+    CachedTimeFormatter,
+    configure_logging,
+    get_logger,
+)
 
 
 class TestLoggingUtils(unittest.TestCase):
@@ -58,6 +63,31 @@ class TestLoggingUtils(unittest.TestCase):
         # Verify logger was returned
         self.assertEqual(logger, mock_logger)
 
+    @patch("falcon_mcp.common.logging.logging.basicConfig")
+    def test_configure_logging_uses_cached_time_formatter(self, mock_basic_config):
+        """Test that the stderr handler formats with CachedTimeFormatter."""
+        configure_logging(name="test_logger")
+
+        _args, kwargs = mock_basic_config.call_args
+        formatter = kwargs["handlers"][0].formatter
+        self.assertIsInstance(formatter, CachedTimeFormatter)
+        self.assertEqual(formatter._fmt, LOG_FORMAT)
+
+    def test_cached_time_formatter_matches_default(self):
+        """Test that cached timestamps match the stdlib rendering."""
+        formatter = CachedTimeFormatter(LOG_FORMAT)
+        default = logging.Formatter(LOG_FORMAT)
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+        later = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+        later.created += 0.25
+        later.msecs = (later.created - int(later.created)) * 1000
+
+        for rec in (record, later, record):
+            self.assertEqual(formatter.formatTime(rec), default.formatTime(rec))
+        self.assertEqual(
+            formatter.formatTime(record, "%Y"), default.formatTime(record, "%Y")
+        )
+
     @patch("falcon_mcp.common.logging.logging.getLogger")
     def test_get_logger_with_name(self, mock_get_logger):
         """Test getting a logger with a specific name."""
@@ -11,6 +11,7 @@ from falcon_mcp.common.utils import (
     filter_none_values,
     generate_md_table,
     prepare_api_parameters,
+    sanitize_input,
 )
 
 
@@ -174,6 +175,18 @@ class TestUtilFunctions(unittest.TestCase):
         )
         self.assertEqual(resource, {"error": "Resource not found"})
 
+    def test_sanitize_input(self):
+        """Test sanitize_input function."""
+        # Quotes, backslashes and control characters are removed
+        self.assertEqual(sanitize_input('a\\b"c\'d\ne\rf\tg'), "abcdefg")
+        self.assertEqual(sanitize_input("example.com"), "example.com")
+
+        # Output is capped at 255 characters
+        self.assertEqual(len(sanitize_input("x" * 300)), 255)
+
+        # Non-string values are converted to strings
+        self.assertEqual(sanitize_input(123), "123")
+
     def test_generate_md_table(self):
         """Test generate_md_table function."""
         # Test data with headers as the first row
@@ -2,7 +2,9 @@
 Tests for the Base module.
 """
 
+import threading
 import unittest
+from unittest.mock import patch
 
 from mcp.types import ToolAnnotations
 
@@ -244,6 +246,73 @@ class TestBaseModule(TestModules):
         # Verify result is empty list
         self.assertEqual(result, [])
 
+    def test_base_get_by_ids_batches_large_id_lists(self):
+        """Test _base_get_by_ids splits IDs into batches and keeps batch order."""
+
+        def respond(operation, body):
+            return {
+                "status_code": 200,
+                "body": {"resources": [{"id": i} for i in body["ids"]]},
+            }
+
+        self.mock_client.command.side_effect = respond
+        ids = [f"id{i}" for i in range(5)]
+
+        result = self.module._base_get_by_ids(
+            "TestOperation", ids, batch_size=2, filter="x"
+        )
+
+        self.assertEqual(result, [{"id": i} for i in ids])
+        self.assertEqual(self.mock_client.command.call_count, 3)
+        sent = sorted(
+            c.kwargs["body"]["ids"] for c in self.mock_client.command.call_args_list
+        )
+        self.assertEqual(sent, [["id0", "id1"], ["id2", "id3"], ["id4"]])
+        for call in self.mock_client.command.call_args_list:
+            self.assertEqual(call.kwargs["body"]["filter"], "x")
+
+    def test_base_get_by_ids_batch_error(self):
+        """Test _base_get_by_ids returns the error when any batch fails."""
+
+        def respond(operation, body):
+            if "id2" in body["ids"]:
+                return {
+                    "status_code": 500,
+                    "body": {"errors": [{"message": "Server error"}]},
+                }
+            return {"status_code": 200, "body": {"resources": [{"id": "ok"}]}}
+
+        self.mock_client.command.side_effect = respond
+
+        result = self.module._base_get_by_ids(
+            "TestOperation", ["id0", "id1", "id2"], batch_size=2
+        )
+
+        self.assertIn("error", result)
+
+    def test_map_concurrently_keeps_item_order(self):
+        """Test _map_concurrently returns one result per item, in item order."""
+        items = list(range(20))
+
+        result = self.module._map_concurrently(lambda i: {"value": i}, items)
+
+        self.assertEqual(result, [{"value": i} for i in items])
+
+    def test_map_concurrently_stops_after_first_error(self):
+        """Test _map_concurrently starts no further items once one has failed."""
+        fetched = []
+
+        def fetch(item):
+            fetched.append(item)
+            return {"error": "boom"} if item == "b" else {"item": item}
+
+        # No free pool slots: the calling thread works through the items alone
+        with patch("falcon_mcp.modules.base._fan_out_slots", threading.Semaphore(0)):
+            result = self.module._map_concurrently(fetch, ["a", "b", "c", "d"])
+
+        self.assertEqual(fetched, ["a", "b"])
+        self.assertEqual(result, [{"item": "a"}, {"error": "boom"}])
+
     def test_base_search_api_call_success(self):
         """Test _base_search_api_call with successful response."""
         # Setup mock response
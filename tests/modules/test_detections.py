@@ -2,6 +2,8 @@
 Tests for the Detections module.
 """
 
+import threading
+import time
 import unittest
 
 from mcp.types import ToolAnnotations
@@ -152,6 +154,38 @@ class TestDetectionsModule(TestModules):
         self.assertEqual(result["results"][0]["composite_id"], "high-sev")
         self.assertEqual(result["results"][1]["composite_id"], "low-sev")
 
+    def test_search_detections_batches_detail_requests(self):
+        """Test that details for more than MAX_DETAIL_COMPOSITE_IDS IDs are
+        fetched in several PostEntitiesAlertsV2 requests."""
+        ids = [f"det{i}" for i in range(1500)]
+
+        def respond(operation, **kwargs):
+            if operation == "GetQueriesAlertsV2":
+                return {"status_code": 200, "body": {"resources": ids}}
+            return {
+                "status_code": 200,
+                "body": {
+                    "resources": [
+                        {"composite_id": i} for i in kwargs["body"]["composite_ids"]
+                    ]
+                },
+            }
+
+        self.mock_client.command.side_effect = respond
+
+        result = self.module.search_detections(limit=1500)
+
+        detail_calls = [
+            c
+            for c in self.mock_client.command.call_args_list
+            if c[0][0] == "PostEntitiesAlertsV2"
+        ]
+        self.assertEqual(
+            sorted(len(c.kwargs["body"]["composite_ids"]) for c in detail_calls),
+            [500, 1000],
+        )
+        self.assertEqual([d["composite_id"] for d in result["results"]], ids)
+
     def test_search_detections_error(self):
         """Test searching for detections with API error returns FQL guide."""
         # Setup mock response with error
@@ -170,6 +204,64 @@ class TestDetectionsModule(TestModules):
         self.assertIn("fql_guide", result)
         self.assertIn("hint", result)
 
+    def test_search_detections_caches_empty_results(self):
+        """Test that a repeated zero-hit search is answered without an API call."""
+        self.mock_client.command.return_value = {
+            "status_code": 200,
+            "body": {"resources": [], "meta": {"pagination": {"total": 0}}},
+        }
+
+        first = self.module.search_detections(filter="status:'new'", limit=10)
+        second = self.module.search_detections(filter="status:'new'", limit=10)
+
+        self.mock_client.command.assert_called_once()
+        self.assertEqual(first, second)
+
+    def test_search_detections_does_not_cache_matches(self):
+        """Test that searches with results are queried every time."""
+        self.mock_client.command.side_effect = lambda operation, **kwargs: (
+            {"status_code": 200, "body": {"resources": ["det1"]}}
+            if operation == "GetQueriesAlertsV2"
+            else {"status_code": 200, "body": {"resources": [{"composite_id": "det1"}]}}
+        )
+
+        self.module.search_detections(filter="status:'new'", limit=10)
+        self.module.search_detections(filter="status:'new'", limit=10)
+
+        query_calls = [
+            c
+            for c in self.mock_client.command.call_args_list
+            if c[0][0] == "GetQueriesAlertsV2"
+        ]
+        self.assertEqual(len(query_calls), 2)
+
+    def test_update_detections_clears_empty_search_cache(self):
+        """Test that updating detections lets a previously empty search re-query."""
+        self.mock_client.command.return_value = {
+            "status_code": 200,
+            "body": {"resources": []},
+        }
+        self.module.search_detections(filter="tags:'fp'", limit=10)
+        self.module.update_detections(
+            ids=["det1"], status=None,
+            assign_to_uuid=None, assign_to_user_id=None,
+            assign_to_name=None, unassign=None, append_comment=None, show_in_ui=None,
+            add_tags=["fp"], remove_tags=None, remove_tags_by_prefix=None,
+        )
+
+        self.mock_client.command.reset_mock()
+        self.module.search_detections(filter="tags:'fp'", limit=10)
+
+        self.mock_client.command.assert_called_once()
+
+    def test_search_detections_rejects_malformed_filter(self):
+        """Test that a structurally invalid filter is rejected without an API call."""
+        result = self.module.search_detections(filter="status:'new' AND severity:>50")
+
+        self.mock_client.command.assert_not_called()
+        self.assertIn("Invalid FQL filter", result["results"][0]["error"])
+        self.assertIn("fql_guide", result)
+
     def test_search_detections_details_error(self):
         """Test that a details-step error (query ok, details 400) returns the wrapped error."""
         query_response = {
@@ -226,6 +318,133 @@ class TestDetectionsModule(TestModules):
         expected_result = [{"id": "detection1", "name": "Test Detection 1"}]
         self.assertEqual(result, expected_result)
 
+    def test_get_detection_details_batches_large_id_lists(self):
+        """Test that more than MAX_DETAIL_COMPOSITE_IDS IDs are split across
+        PostEntitiesAlertsV2 requests and returned in input order."""
+        ids = [f"det{i}" for i in range(2001)]
+
+        def respond(operation, **kwargs):
+            return {
+                "status_code": 200,
+                "body": {
+                    "resources": [
+                        {"composite_id": i} for i in kwargs["body"]["composite_ids"]
+                    ]
+                },
+            }
+
+        self.mock_client.command.side_effect = respond
+
+        result = self.module.get_detection_details(ids)
+
+        self.assertEqual(self.mock_client.command.call_count, 3)
+        self.assertEqual([d["composite_id"] for d in result], ids)
+
+    def test_get_detection_details_coalesces_concurrent_duplicates(self):
+        """Test that identical concurrent lookups share one API request."""
+        started = threading.Event()
+
+        def respond(operation, **kwargs):
+            started.set()
+            time.sleep(0.2)
+            return {"status_code": 200, "body": {"resources": [{"composite_id": "a"}]}}
+
+        self.mock_client.command.side_effect = respond
+        results = []
+
+        def lookup():
+            results.append(self.module.get_detection_details(["a"]))
+
+        leader = threading.Thread(target=lookup)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=lookup)
+        follower.start()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(self.mock_client.command.call_count, 1)
+        self.assertEqual(results, [[{"composite_id": "a"}]] * 2)
+
+    def test_get_detection_details_uses_cache(self):
+        """Test that repeated lookups are served from the cache."""
+        self.mock_client.command.return_value = {
+            "status_code": 200,
+            "body": {"resources": [{"composite_id": "det1", "status": "new"}]},
+        }
+
+        first = self.module.get_detection_details(["det1"], include_hidden=True)
+        second = self.module.get_detection_details(["det1"], include_hidden=True)
+
+        self.mock_client.command.assert_called_once()
+        self.assertEqual(first, second)
+
+    def test_get_detection_details_cache_respects_include_hidden(self):
+        """Test that include_hidden is part of the cache key."""
+        self.mock_client.command.return_value = {
+            "status_code": 200,
+            "body": {"resources": [{"composite_id": "det1"}]},
+        }
+
+        self.module.get_detection_details(["det1"], include_hidden=True)
+        self.module.get_detection_details(["det1"], include_hidden=False)
+
+        self.assertEqual(self.mock_client.command.call_count, 2)
+
+    def test_update_detections_invalidates_cache(self):
+        """Test that updated detections are refetched on the next lookup."""
+        self.mock_client.command.return_value = {
+            "status_code": 200,
+            "body": {"resources": [{"composite_id": "det1"}]},
+        }
+        self.module.get_detection_details(["det1"], include_hidden=True)
+        self.module.update_detections(
+            ids=["det1"], status="in_progress",
+            assign_to_uuid=None, assign_to_user_id=None,
+            assign_to_name=None, unassign=None, append_comment=None, show_in_ui=None,
+            add_tags=None, remove_tags=None, remove_tags_by_prefix=None,
+        )
+
+        self.mock_client.command.reset_mock()
+        self.module.get_detection_details(["det1"], include_hidden=True)
+
+        self.mock_client.command.assert_called_once()
+        self.assertEqual(self.mock_client.command.call_args[0][0], "PostEntitiesAlertsV2")
+
+    def test_get_detection_details_discards_fetch_that_raced_an_update(self):
+        """Test that a record fetched while an update ran is not cached."""
+
+        def respond(operation, **kwargs):
+            # An update to the same alert finishes while this fetch is in flight
+            self.module._invalidate_alerts(["det1"])
+            return {"status_code": 200, "body": {"resources": [{"composite_id": "det1"}]}}
+
+        self.mock_client.command.side_effect = respond
+
+        self.module.get_detection_details(["det1"], include_hidden=True)
+        self.module.get_detection_details(["det1"], include_hidden=True)
+
+        self.assertEqual(self.mock_client.command.call_count, 2)
+
+    def test_update_detections_invalidates_cache_on_failure(self):
+        """Test that a failed update still evicts the targeted detections."""
+        self.mock_client.command.return_value = {
+            "status_code": 200,
+            "body": {"resources": [{"composite_id": "det1"}]},
+        }
+        self.module.get_detection_details(["det1"], include_hidden=True)
+        self.mock_client.command.side_effect = RuntimeError("connection reset")
+
+        with self.assertRaises(RuntimeError):
+            self.module.update_detections(
+                ids=["det1"], status="closed",
+                assign_to_uuid=None, assign_to_user_id=None,
+                assign_to_name=None, unassign=None, append_comment=None, show_in_ui=None,
+                add_tags=None, remove_tags=None, remove_tags_by_prefix=None,
+            )
+
+        self.assertIsNone(self.module._alert_cache.get(("det1", True)))
+
     def test_get_detection_details_not_found(self):
         """Test getting detection details for non-existent detection."""
         # Setup mock response with empty resources
@@ -351,6 +351,25 @@ class TestHostsModule(TestModules):
         self.assertEqual(result, [])
         self.mock_client.command.assert_not_called()
 
+    def test_get_host_details_is_not_cached(self):
+        """Test that sequential lookups always fetch current host records."""
+        self.mock_client.command.side_effect = [
+            {
+                "status_code": 200,
+                "body": {"resources": [{"device_id": "device1", "groups": []}]},
+            },
+            {
+                "status_code": 200,
+                "body": {"resources": [{"device_id": "device1", "groups": ["group1"]}]},
+            },
+        ]
+
+        self.module.get_host_details(["device1"])
+        result = self.module.get_host_details(["device1"])
+
+        self.assertEqual(self.mock_client.command.call_count, 2)
+        self.assertEqual(result[0]["groups"], ["group1"])
+
     def test_search_hosts_windows_platform(self):
         """Test searching for Windows hosts."""
         # Setup mock responses
@@ -864,6 +864,66 @@ class TestIdpModule(TestModules):
 
         self.assertTrue(self.mock_client.command.called)
 
+    def test_entity_timelines_batch_queries_each_entity(self):
+        """Per-entity timeline queries all run and keep the input order."""
+        entity_ids = ["entity-1", "entity-2", "entity-3"]
+
+        def timeline_for(operation, body):
+            entity_id = next(e for e in entity_ids if e in body["query"])
+            return {
+                "status_code": 200,
+                "body": {"data": {"timeline": {"nodes": [{"eventId": entity_id}]}}},
+            }
+
+        self.mock_client.command.side_effect = timeline_for
+
+        result = self.module._get_entity_timelines_batch(entity_ids, {})
+
+        self.assertEqual(self.mock_client.command.call_count, 3)
+        self.assertEqual(
+            [t["entity_id"] for t in result["timelines"]], entity_ids
+        )
+        self.assertEqual(
+            [t["timeline"][0]["eventId"] for t in result["timelines"]], entity_ids
+        )
+
+    def test_relationships_batch_returns_first_error(self):
+        """A failed per-entity query is returned as the batch error."""
+        def relationships_for(operation, body):
+            if "entity-2" in body["query"]:
+                return {"status_code": 500, "body": {"errors": [{"message": "boom"}]}}
+            return {"status_code": 200, "body": {"data": {"entities": {"nodes": []}}}}
+
+        self.mock_client.command.side_effect = relationships_for
+
+        result = self.module._analyze_relationships_batch(
+            ["entity-1", "entity-2", "entity-3"], {}
+        )
+
+        self.assertIn("error", result)
+        self.assertIn("entity-2", result["error"])
+
+    def test_multi_entity_patterns_counts_shared_risk_factors(self):
+        """Risk factors seen on more than one entity are reported as common."""
+        investigation_results = {
+            "risk_assessment": {
+                "risk_assessments": [
+                    {"riskFactors": [{"type": "STALE_ACCOUNT"}, {"type": "WEAK_PASSWORD"}]},
+                    {"riskFactors": [{"type": "STALE_ACCOUNT"}]},
+                    {"riskFactors": []},
+                ]
+            }
+        }
+
+        patterns = self.module._analyze_multi_entity_patterns(
+            investigation_results, ["entity-1", "entity-2", "entity-3", "entity-4"]
+        )
+
+        self.assertEqual(
+            patterns["common_risk_factors"],
+            [{"risk_type": "STALE_ACCOUNT", "entity_count": 2, "percentage": 50.0}],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -7,7 +7,7 @@ import os
 import unittest
 from unittest.mock import AsyncMock, patch
 
-from falcon_mcp.modules.ngsiem import NGSIEMModule
+from falcon_mcp.modules.ngsiem import NGSIEMModule, _iso_to_epoch_ms
 from tests.modules.utils.test_modules import TestModules
 
 
@@ -434,5 +434,15 @@ class TestNGSIEMModuleConfig(unittest.TestCase):
             self.assertEqual(timeout, 60)
 
 
+class TestIsoToEpochMs(unittest.TestCase):
+    """Test cases for the ISO 8601 to epoch conversion helper."""
+
+    def test_utc_designators(self):
+        """The Z suffix and an explicit UTC offset convert identically."""
+        self.assertEqual(_iso_to_epoch_ms("2025-02-06T00:00:00Z"), 1738800000000)
+        self.assertEqual(_iso_to_epoch_ms("2025-02-06T00:00:00+00:00"), 1738800000000)
+        self.assertEqual(_iso_to_epoch_ms("2025-02-06T01:00:00.5+01:00"), 1738800000500)
+
+
 if __name__ == "__main__":
     unittest.main()
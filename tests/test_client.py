@@ -7,7 +7,13 @@ import sys
 import unittest
 from unittest.mock import MagicMock, patch
 
-from falcon_mcp.client import FalconClient
+from falcon_mcp.client import (
+    MAX_RATE_LIMIT_RETRIES,
+    MAX_RATE_LIMIT_WAIT_SECONDS,
+    RATE_LIMIT_BACKOFF_SECONDS,
+    FalconClient,
+    _rate_limit_delay,
+)
 
 
 class TestFalconClient(unittest.TestCase):
@@ -90,6 +96,22 @@ class TestFalconClient(unittest.TestCase):
         self.assertEqual(call_args["client_id"], "direct-client-id")
         self.assertEqual(call_args["client_secret"], "direct-client-secret")
 
+    @patch("falcon_mcp.client.os.environ.get")
+    @patch("falcon_mcp.client.APIHarnessV2")
+    def test_client_does_not_retain_credentials(self, mock_apiharness, mock_environ_get):
+        """Test that credentials are passed through rather than stored on the client."""
+        mock_environ_get.return_value = None
+        mock_apiharness.return_value = MagicMock()
+
+        client = FalconClient(
+            client_id="direct-client-id",
+            client_secret="direct-client-secret",
+        )
+
+        self.assertFalse(hasattr(client, "__dict__"))
+        self.assertFalse(hasattr(client, "client_id"))
+        self.assertFalse(hasattr(client, "client_secret"))
+
     @patch("falcon_mcp.client.os.environ.get")
     @patch("falcon_mcp.client.APIHarnessV2")
     def test_client_direct_credentials_override_env_vars(
@@ -229,6 +251,134 @@ class TestFalconClient(unittest.TestCase):
         self.assertEqual(response["status_code"], 200)
         self.assertEqual(response["body"]["resources"][0]["id"], "test")
 
+    @patch("falcon_mcp.client.time.sleep")
+    @patch("falcon_mcp.client.os.environ.get")
+    @patch("falcon_mcp.client.APIHarnessV2")
+    def test_command_retries_rate_limited_requests(
+        self, mock_apiharness, mock_environ_get, mock_sleep
+    ):
+        """Test that HTTP 429 responses are retried with backoff."""
+        mock_environ_get.side_effect = lambda key, default=None: {
+            "FALCON_CLIENT_ID": "test-client-id",
+            "FALCON_CLIENT_SECRET": "test-client-secret",
+        }.get(key, default)
+
+        rate_limited = {"status_code": 429, "headers": {}, "body": {"errors": []}}
+        success = {"status_code": 200, "body": {"resources": [{"id": "test"}]}}
+        mock_instance = MagicMock()
+        mock_instance.command.side_effect = [rate_limited, rate_limited, success]
+        mock_apiharness.return_value = mock_instance
+
+        client = FalconClient()
+        response = client.command("TestOperation", parameters={"filter": "test"})
+
+        self.assertEqual(response, success)
+        self.assertEqual(mock_instance.command.call_count, 3)
+        self.assertEqual(
+            [c.args[0] for c in mock_sleep.call_args_list],
+            [RATE_LIMIT_BACKOFF_SECONDS, RATE_LIMIT_BACKOFF_SECONDS * 2],
+        )
+
+    @patch("falcon_mcp.client.time.sleep")
+    @patch("falcon_mcp.client.os.environ.get")
+    @patch("falcon_mcp.client.APIHarnessV2")
+    def test_command_gives_up_after_max_rate_limit_retries(
+        self, mock_apiharness, mock_environ_get, mock_sleep
+    ):
+        """Test that a persistent 429 is returned after the retry budget."""
+        mock_environ_get.side_effect = lambda key, default=None: {
+            "FALCON_CLIENT_ID": "test-client-id",
+            "FALCON_CLIENT_SECRET": "test-client-secret",
+        }.get(key, default)
+
+        rate_limited = {"status_code": 429, "headers": {}, "body": {"errors": []}}
+        mock_instance = MagicMock()
+        mock_instance.command.return_value = rate_limited
+        mock_apiharness.return_value = mock_instance
+
+        client = FalconClient()
+        response = client.command("TestOperation")
+
+        self.assertEqual(response["status_code"], 429)
+        self.assertEqual(mock_instance.command.call_count, MAX_RATE_LIMIT_RETRIES + 1)
+        self.assertEqual(mock_sleep.call_count, MAX_RATE_LIMIT_RETRIES)
+
+    @patch("falcon_mcp.client.time.time")
+    @patch("falcon_mcp.client.time.sleep")
+    @patch("falcon_mcp.client.os.environ.get")
+    @patch("falcon_mcp.client.APIHarnessV2")
+    def test_command_returns_429_when_reset_exceeds_wait_budget(
+        self, mock_apiharness, mock_environ_get, mock_sleep, mock_time
+    ):
+        """Test that a reset beyond the retry budget is returned without sleeping."""
+        mock_environ_get.side_effect = lambda key, default=None: {
+            "FALCON_CLIENT_ID": "test-client-id",
+            "FALCON_CLIENT_SECRET": "test-client-secret",
+        }.get(key, default)
+        mock_time.return_value = 1000.0
+
+        reset = str(1000.0 + MAX_RATE_LIMIT_WAIT_SECONDS + 1)
+        rate_limited = {
+            "status_code": 429,
+            "headers": {"X-Ratelimit-Retryafter": reset},
+            "body": {"errors": []},
+        }
+        mock_instance = MagicMock()
+        mock_instance.command.return_value = rate_limited
+        mock_apiharness.return_value = mock_instance
+
+        client = FalconClient()
+        response = client.command("TestOperation")
+
+        self.assertEqual(response, rate_limited)
+        mock_instance.command.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("falcon_mcp.client.time.sleep")
+    @patch("falcon_mcp.client.os.environ.get")
+    @patch("falcon_mcp.client.APIHarnessV2")
+    def test_command_returns_binary_responses_unchanged(
+        self, mock_apiharness, mock_environ_get, mock_sleep
+    ):
+        """Test that raw bytes from download endpoints pass through the retry check."""
+        mock_environ_get.side_effect = lambda key, default=None: {
+            "FALCON_CLIENT_ID": "test-client-id",
+            "FALCON_CLIENT_SECRET": "test-client-secret",
+        }.get(key, default)
+
+        mock_instance = MagicMock()
+        mock_instance.command.return_value = b"%PDF-1.7 report"
+        mock_apiharness.return_value = mock_instance
+
+        client = FalconClient()
+        response = client.command("GetMitreReport", parameters={"id": "actor"})
+
+        self.assertEqual(response, b"%PDF-1.7 report")
+        mock_instance.command.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("falcon_mcp.client.time.time")
+    def test_rate_limit_delay_uses_retry_after_header(self, mock_time):
+        """Test that the reset timestamp header drives the retry delay."""
+        mock_time.return_value = 1000.0
+
+        self.assertEqual(
+            _rate_limit_delay({"headers": {"X-Ratelimit-Retryafter": "1004"}}, 0), 4.0
+        )
+        # Resets in the past retry immediately
+        self.assertEqual(
+            _rate_limit_delay({"headers": {"X-Ratelimit-Retryafter": "900"}}, 0), 0.0
+        )
+        self.assertEqual(
+            _rate_limit_delay({"headers": {"x-ratelimit-retryafter": "5000"}}, 0), 4000.0
+        )
+        # Missing or malformed headers fall back to exponential backoff
+        self.assertEqual(_rate_limit_delay({}, 2), RATE_LIMIT_BACKOFF_SECONDS * 4)
+        self.assertEqual(
+            _rate_limit_delay({"headers": {"X-Ratelimit-Retryafter": "soon"}}, 0),
+            RATE_LIMIT_BACKOFF_SECONDS,
+        )
+
     @patch("falcon_mcp.client.version")
     @patch("falcon_mcp.client.os.environ.get")
     @patch("falcon_mcp.client.APIHarnessV2")